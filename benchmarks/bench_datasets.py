@@ -0,0 +1,63 @@
+"""
+Compare the load paths for the shipped text datasets: np.loadtxt on the
+text file against the compiled .npy copy (read fully and memory-mapped).
+
+The registry's in-process memoization is bypassed so that every call
+measures a real read. The shipped files are tiny, so synthetic files of
+increasing size are timed as well to show how both paths scale.
+
+    python benchmarks/bench_datasets.py [--repeat N]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from wbi_teaching_applied_ml_utils._datasets import (TEXT_DATASETS, compile_text, compiled_path, dataset_path,
+                                                     loadtxt_compiled)
+
+
+def best_of(fn, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(name, path, kwargs, repeat):
+    compile_text(path, **kwargs)
+    text = best_of(lambda: np.loadtxt(path, **kwargs), repeat)
+    binary = best_of(lambda: loadtxt_compiled(path, **kwargs), repeat)
+    mapped = best_of(lambda: loadtxt_compiled(path, mmap_mode='r', **kwargs), repeat)
+    print(f"{name:32s} {1000 * text:11.3f} {1000 * binary:9.3f} {1000 * mapped:9.3f} "
+          f"{text / binary:7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'dataset':32s} {'loadtxt ms':>11s} {'npy ms':>9s} {'mmap ms':>9s} {'speedup':>8s}")
+    for parts, kwargs in TEXT_DATASETS:
+        report('/'.join(parts), dataset_path(*parts), kwargs, args.repeat)
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in (1000, 10000, 100000):
+            path = os.path.join(tmp, f'synthetic_{rows}.txt')
+            np.savetxt(path, rng.standard_normal((rows, 3)), delimiter=',')
+            kwargs = dict(delimiter=',', dtype=np.float64)
+            report(f'synthetic {rows} x 3', path, kwargs, max(1, args.repeat // 4))
+
+            # do not leave the synthetic copies behind in the user's cache
+            target = compiled_path(path, **kwargs)
+            os.remove(target)
+            os.remove(target + '.json')
+
+if __name__ == '__main__':
+    main()
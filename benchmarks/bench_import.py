@@ -0,0 +1,64 @@
+"""
+Import-time benchmark for wbi_teaching_applied_ml_utils.
+
+Every scenario runs in a fresh interpreter so that nothing is already
+cached in sys.modules. The 'eager' scenario imports the third-party modules
+the package used to load at import time and serves as the baseline.
+
+    python benchmarks/bench_import.py [--repeat N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    'eager (old __init__ imports)': (
+        "import requests, json, pandas, numpy, matplotlib.pyplot\n"
+        "from PIL import Image\n"
+        "from IPython.display import display\n"
+        "from matplotlib.widgets import Slider\n"
+        "import matplotlib.image\n"
+        "from sklearn.model_selection import train_test_split\n"
+        "from sklearn.pipeline import make_pipeline\n"
+        "from sklearn.preprocessing import StandardScaler, PolynomialFeatures\n"
+        "from sklearn.linear_model import Lasso, Ridge, LinearRegression\n"
+    ),
+    'import package': "import wbi_teaching_applied_ml_utils",
+    'Exercise2Utils.load_data_exercise_2()': (
+        "from wbi_teaching_applied_ml_utils import Exercise2Utils\n"
+        "Exercise2Utils.load_data_exercise_2()\n"
+    ),
+    'all Utils classes': (
+        "from wbi_teaching_applied_ml_utils import (LinearAlgebraUtils, Exercise1Utils,\n"
+        "    Exercise2Utils, Exercise3Utils, Exercise4Utils, Exercise5Utils)\n"
+    ),
+}
+
+
+def time_snippet(code, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = time_snippet('pass', args.repeat)
+    startup = statistics.median(baseline)
+    print(f"{'interpreter startup':40s} {1000 * startup:8.1f} ms")
+
+    for name, code in SCENARIOS.items():
+        median = statistics.median(time_snippet(code, args.repeat))
+        print(f"{name:40s} {1000 * median:8.1f} ms  (+{1000 * (median - startup):.1f} ms over startup)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Search latency of Exercise1Utils.KNNIndex against the query batch size.
+
+Uses synthetic embeddings of the same shape as the dog embeddings.
+
+    python benchmarks/bench_knn.py [--rows N] [--dim D] [--k K]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from wbi_teaching_applied_ml_utils import Exercise1Utils
+
+
+def time_search(index, queries, k, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        index.search(queries, k)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--dim', type=int, default=512)
+    parser.add_argument('--k', type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((args.rows, args.dim)).astype(np.float32)
+    queries = rng.standard_normal((1024, args.dim)).astype(np.float32)
+
+    indexes = {}
+    for metric in ('cosine', 'l2'):
+        indexes[f'{metric} exact'] = Exercise1Utils.KNNIndex(x, metric=metric)
+    start = time.perf_counter()
+    indexes['cosine ivf'] = Exercise1Utils.KNNIndex(x, metric='cosine', approximate=True)
+    print(f"ivf build: {time.perf_counter() - start:.2f}s")
+
+    print(f"{'index':14s} {'batch':>6s} {'total ms':>10s} {'ms/query':>10s} {'queries/s':>10s}")
+    for name, index in indexes.items():
+        for batch in (1, 8, 64, 256, 1024):
+            seconds = time_search(index, queries[:batch], args.k)
+            print(f"{name:14s} {batch:6d} {1000 * seconds:10.2f} {1000 * seconds / batch:10.3f} "
+                  f"{batch / seconds:10.0f}")
+
+
+if __name__ == '__main__':
+    main()
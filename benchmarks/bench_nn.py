@@ -0,0 +1,59 @@
+"""
+Inference throughput (images/s) of Exercise5Utils.DenseNetwork.
+
+Scores synthetic 28x28 images with the weights of exercise 5 for several
+batch sizes and dtypes, against an unbatched float64 forward pass.
+
+    python benchmarks/bench_nn.py [--images N]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from wbi_teaching_applied_ml_utils import Exercise5Utils
+
+
+def best_time(fn, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def naive_forward(X, W1, b1, W2, b2):
+    # the forward pass as written in the notebooks, on the whole input at once
+    a1 = 1 / (1 + np.exp(-(X @ W1 + b1)))
+    z2 = a1 @ W2 + b2
+    e = np.exp(z2 - z2.max(axis=1, keepdims=True))
+    return e / e.sum(axis=1, keepdims=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--images', type=int, default=200000)
+    args = parser.parse_args()
+
+    weights = Exercise5Utils.load_weights_task1()
+    rng = np.random.default_rng(0)
+    images = rng.random((args.images, 28, 28), dtype=np.float32)
+
+    X64 = images.reshape(len(images), -1).astype(np.float64)
+    W64 = [np.asarray(w, dtype=np.float64) for w in weights]
+    seconds = best_time(lambda: naive_forward(X64, *W64))
+    print(f"{'engine':24s} {'batch':>6s} {'seconds':>8s} {'images/s':>12s}")
+    print(f"{'naive float64':24s} {'all':>6s} {seconds:8.3f} {args.images / seconds:12.0f}")
+
+    for dtype in (np.float64, np.float32):
+        out = np.empty((len(images), 10), dtype=dtype)
+        for batch_size in (64, 256, 1024, 4096, 16384):
+            net = Exercise5Utils.DenseNetwork(*weights, dtype=dtype, batch_size=batch_size)
+            seconds = best_time(lambda: net.forward(images, out=out))
+            name = f'DenseNetwork {np.dtype(dtype).name}'
+            print(f"{name:24s} {batch_size:6d} {seconds:8.3f} {args.images / seconds:12.0f}")
+
+
+if __name__ == '__main__':
+    main()
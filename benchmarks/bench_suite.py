@@ -0,0 +1,277 @@
+"""
+Wall time and peak memory of the dataset loaders and plotting helpers.
+
+Every case runs headless on the Agg backend; plotting cases include
+rendering the figure. Synthetic inputs of several sizes are used so that
+scaling regressions show up, and images are served by a local stand-in
+HTTP server instead of the network. Caches are written to a temporary
+directory, so the user's cache is left alone.
+
+    python benchmarks/bench_suite.py [--filter TEXT] [--repeat N] [--json PATH]
+"""
+import argparse
+import functools
+import gzip
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from wbi_teaching_applied_ml_utils import (Exercise1Utils, Exercise2Utils, Exercise3Utils,  # noqa: E402
+                                           Exercise4Utils, Exercise5Utils, LinearAlgebraUtils)
+from wbi_teaching_applied_ml_utils._datasets import dataset_registry  # noqa: E402
+from wbi_teaching_applied_ml_utils._embeddings import load_embeddings  # noqa: E402
+from wbi_teaching_applied_ml_utils._images import fetch_images  # noqa: E402
+
+CASES = []
+
+
+def case(name, sizes=(None,)):
+    """
+    Register `setup(size)`, which prepares the inputs and returns the
+    function to measure, once for every size.
+    """
+    def register(setup):
+        for size in sizes:
+            CASES.append((name, size, setup))
+        return setup
+    return register
+
+
+def fresh_registry(fn):
+    # loaders are memoized per process; clear the registry so that every
+    # call measures a real read
+    @functools.wraps(fn)
+    def run():
+        dataset_registry.clear()
+        return fn()
+    return run
+
+
+def draw_figures():
+    for num in plt.get_fignums():
+        plt.figure(num).canvas.draw()
+    plt.close('all')
+
+
+def measure(fn, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        draw_figures()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    draw_figures()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+# ---------------------------------------------------------------- loaders
+
+def _loader(name, fn):
+    case(name)(lambda size: fresh_registry(fn))
+
+
+_loader('load_salary_data', LinearAlgebraUtils.load_salary_data)
+_loader('load_data_exercise_1', Exercise1Utils.load_data_exercise_1)
+_loader('load_data_exercise_1_dog_embeddings', lambda: Exercise1Utils.load_data_exercise_1_dog_embeddings(None))
+_loader('load_data_exercise_2', Exercise2Utils.load_data_exercise_2)
+_loader('load_exam_data', Exercise3Utils.load_exam_data)
+_loader('load_microchip_data', Exercise3Utils.load_microchip_data)
+_loader('load_sentiment_data', Exercise3Utils.load_sentiment_data)
+_loader('vectorize_sentiment_data', Exercise3Utils.vectorize_sentiment_data)
+_loader('load_data (exercise 4)', lambda: Exercise4Utils.load_data('ex6data3_train.txt'))
+_loader('load_weights_task1', Exercise5Utils.load_weights_task1)
+
+
+@case('load_embeddings (synthetic csv)', sizes=(1000, 5000, 20000))
+def bench_embeddings(rows):
+    path = os.path.join(tempfile.mkdtemp(), 'vectors.csv.gz')
+    rng = np.random.default_rng(0)
+    with gzip.open(path, 'wt') as f:
+        # same layout as datasets/exercise1/vectors.csv.gz
+        f.write(';class;dir;filename;embedding\n')
+        for i in range(rows):
+            vector = ', '.join(f'{v:.6f}' for v in rng.standard_normal(512))
+            f.write(f'{i};c{i % 10};c{i % 10};f{i};[{vector}]\n')
+    return lambda: load_embeddings(path, subset=[f'c{i}' for i in range(5)], use_cache=False)
+
+
+# ------------------------------------------------------- feature mapping
+
+@case('mapFeature', sizes=(1000, 100000, 1000000))
+def bench_map_feature(rows):
+    X1, X2 = np.random.default_rng(0).standard_normal((2, rows))
+    return lambda: Exercise3Utils.mapFeature(X1, X2)
+
+
+# -------------------------------------------------------------- plotting
+
+@case('plotDecisionBoundary', sizes=(50, 200, 500))
+def bench_plot_decision_boundary(grid_size):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((118, 2))
+    X = Exercise3Utils.mapFeature(x[:, 0], x[:, 1])
+    y = (x[:, 0]**2 + x[:, 1]**2 < 1).astype(float)
+    theta = rng.standard_normal(X.shape[1])
+    return lambda: Exercise3Utils.plotDecisionBoundary(Exercise3Utils.plotData, theta, X, y,
+                                                       grid_size=grid_size)
+
+
+@case('plotMargin', sizes=(5, 10, 20))
+def bench_plot_margin(extent):
+    # the grid spacing is fixed, so the spread of the data sets the grid size
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-extent, extent, (200, 2))
+    w = np.array([0.1, 1.0, -1.0])
+    y = np.where(x[:, 0] > x[:, 1], 1, -1)
+
+    def predict(w, points):
+        return np.sign(points @ w)
+    return lambda: Exercise4Utils.plotMargin(x, y, w, True, predict)
+
+
+def _svm_data(rows):
+    from sklearn.svm import SVC
+
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 1, (rows, 2))
+    y = (np.hypot(X[:, 0] - 0.5, X[:, 1] - 0.5) < 0.3).astype(int)
+    return X, y, SVC(kernel='rbf', gamma=30).fit(X, y)
+
+
+@case('visualizeBoundary', sizes=(100, 1000, 5000))
+def bench_visualize_boundary(rows):
+    X, y, clf = _svm_data(rows)
+    return lambda: Exercise4Utils.visualizeBoundary(X, y, clf)
+
+
+@case('visualizeBoundary (dense)', sizes=(100, 1000))
+def bench_visualize_boundary_dense(rows):
+    X, y, clf = _svm_data(rows)
+    return lambda: Exercise4Utils.visualizeBoundary(X, y, clf, adaptive=False)
+
+
+def _digits(rows):
+    path = os.path.join(tempfile.mkdtemp(), 'digits.npy')
+    X = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=(rows, 784))
+    X[:] = np.random.default_rng(0).random((rows, 784), dtype=np.float32)
+    X.flush()
+    return np.load(path, mmap_mode='r'), np.arange(rows) % 10
+
+
+for _mosaic in (False, True):
+    _suffix = ' (mosaic)' if _mosaic else ''
+
+    @case('plot_images' + _suffix, sizes=(1000, 100000))
+    def bench_plot_images(rows, mosaic=_mosaic):
+        X, y = _digits(rows)
+        return lambda: Exercise5Utils.plot_images(X, y, mosaic=mosaic)
+
+    @case('display_images' + _suffix, sizes=(1000, 100000))
+    def bench_display_images(rows, mosaic=_mosaic):
+        X, _ = _digits(rows)
+        return lambda: Exercise5Utils.display_images(X, mosaic=mosaic)
+
+
+@case('plotPolyLines', sizes=(5, 10, 20))
+def bench_plot_poly_lines(degree):
+    x, y, _ = Exercise2Utils.load_data_exercise_2()
+    return lambda: Exercise2Utils.plotPolyLines(x[:30], y[:30], x[30:], y[30:], None, degree)
+
+
+# ------------------------------------------------------ images over http
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def start_image_server(n_images=12):
+    """
+    Serve n_images synthetic jpegs as <url>/n01/f<i>.jpg from a local
+    HTTP server running in a daemon thread. Returns the base url.
+    """
+    from PIL import Image
+
+    root = tempfile.mkdtemp()
+    os.makedirs(os.path.join(root, 'n01'))
+    rng = np.random.default_rng(0)
+    for i in range(n_images):
+        pixels = rng.integers(0, 256, (375, 500, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(os.path.join(root, 'n01', f'f{i}.jpg'), quality=90)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(_QuietHandler, directory=root))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_address[1]}'
+
+
+@case('fetch_images (cold)', sizes=(1, 6, 12))
+def bench_fetch_cold(n):
+    urls = [f'{Exercise1Utils.images_URL}/n01/f{i}.jpg' for i in range(n)]
+    return lambda: fetch_images(urls, cache=False)
+
+
+@case('plot_dog')
+def bench_plot_dog(size):
+    return lambda: Exercise1Utils.plot_dog('n01/f0', 'n01')
+
+
+@case('plot_knn_results', sizes=(5, 11))
+def bench_plot_knn_results(k):
+    neighbours = [f'n01/f{i}' for i in range(1, k + 1)]
+    return lambda: Exercise1Utils.plot_knn_results('n01/f0', 'n01', neighbours, ['n01'] * k)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--filter', default='', help='only run cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+
+    # keep compiled datasets and image blobs out of the user's cache
+    os.environ['WBI_AML_CACHE_DIR'] = tempfile.mkdtemp(prefix='wbi-aml-bench-')
+    Exercise1Utils.images_URL = start_image_server()
+    Exercise1Utils.images_offline = False
+
+    results = []
+    print(f"{'case':36s} {'size':>8s} {'ms':>10s} {'peak MB':>9s}")
+    for name, size, setup in CASES:
+        if args.filter not in name:
+            continue
+        label = '' if size is None else str(size)
+        try:
+            fn = setup(size)
+            seconds, peak = measure(fn, args.repeat)
+        except (OSError, ImportError) as e:
+            # e.g. a dataset that is not shipped with this checkout
+            print(f"{name:36s} {label:>8s} {'skipped':>10s}  {type(e).__name__}: {e}")
+            plt.close('all')
+            continue
+        results.append({'case': name, 'size': size, 'seconds': seconds, 'peak_bytes': peak})
+        print(f"{name:36s} {label:>8s} {1000 * seconds:10.2f} {peak / 2**20:9.2f}")
+        sys.stdout.flush()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+import contextlib
+import inspect
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from ._lazy import lazy_import
+
+_pyplot = lazy_import('matplotlib.pyplot')
+_local = threading.local()
+
+# pyplot functions that set (with arguments) or get (without) a property
+# of the current axes
+_AXES_PROPERTIES = {'xlabel', 'ylabel', 'title', 'xlim', 'ylim', 'xticks', 'yticks', 'xscale', 'yscale'}
+_FIGURE_METHODS = {'tight_layout', 'subplots_adjust', 'suptitle', 'savefig', 'colorbar'}
+_NO_OPS = {'show', 'draw', 'pause', 'ion', 'ioff', 'draw_if_interactive'}
+
+
+def _new_figure(figures, num=None, clear=False, **kwargs):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    figures.append(fig)
+    return fig
+
+
+def _gcf(figures):
+    return figures[-1] if figures else _new_figure(figures)
+
+
+# keywords of plt.subplots that go to Figure.subplots rather than to the
+# figure; only the ones given are forwarded, since older matplotlib
+# versions do not know all of them (width_ratios, height_ratios: 3.6)
+_SUBPLOTS_KEYWORDS = {'sharex', 'sharey', 'squeeze', 'width_ratios', 'height_ratios', 'subplot_kw', 'gridspec_kw'}
+
+
+def _split_subplots_kwargs(kwargs):
+    subplots_kw = {k: v for k, v in kwargs.items() if k in _SUBPLOTS_KEYWORDS}
+    fig_kw = {k: v for k, v in kwargs.items() if k not in _SUBPLOTS_KEYWORDS}
+    return subplots_kw, fig_kw
+
+
+def _subplots(figures, nrows=1, ncols=1, **kwargs):
+    subplots_kw, fig_kw = _split_subplots_kwargs(kwargs)
+    fig = _new_figure(figures, **fig_kw)
+    return fig, fig.subplots(nrows, ncols, **subplots_kw)
+
+
+def _close(figures, fig=None):
+    if isinstance(fig, str) and fig == 'all':
+        figures.clear()
+    elif fig is None:
+        del figures[-1:]
+    elif fig in figures:
+        figures.remove(fig)
+
+
+def _axes_property(figures, name):
+    def accessor(*args, **kwargs):
+        ax = _gcf(figures).gca()
+        if not args and not kwargs:
+            return getattr(ax, f'get_{name}')()
+        return getattr(ax, f'set_{name}')(*args, **kwargs)
+    return accessor
+
+
+def _batch_attr(figures, name):
+    from matplotlib.axes import Axes
+
+    if name == 'figure':
+        return lambda *args, **kwargs: _new_figure(figures, *args, **kwargs)
+    if name == 'subplots':
+        return lambda *args, **kwargs: _subplots(figures, *args, **kwargs)
+    if name == 'subplot':
+        return lambda *args, **kwargs: _gcf(figures).add_subplot(*args, **kwargs)
+    if name == 'gcf':
+        return lambda: _gcf(figures)
+    if name == 'gca':
+        return lambda: _gcf(figures).gca()
+    if name == 'close':
+        return lambda fig=None: _close(figures, fig)
+    if name in _NO_OPS:
+        return lambda *args, **kwargs: None
+    if name in _FIGURE_METHODS:
+        return getattr(_gcf(figures), name)
+    if name in _AXES_PROPERTIES:
+        return _axes_property(figures, name)
+    if callable(getattr(Axes, name, None)):
+        # plot, scatter, contour, imshow, legend, text, axis, grid, ...
+        return getattr(_gcf(figures).gca(), name)
+
+    value = getattr(_pyplot, name)
+    if inspect.isfunction(value):
+        raise AttributeError(f'pyplot.{name} is not supported in batch mode')
+    # modules and constants such as plt.cm
+    return value
+
+
+class FigurePool:
+    """
+    Reuse of the figures created by the plotting helpers.
+
+    Every call site of plt.figure/plt.subplots in a helper owns one pyplot
+    figure, which is cleared and redrawn on the next call instead of
+    allocating a new one. At most `max_figures` pooled figures are kept
+    open; the least recently used ones are closed.
+    """
+
+    def __init__(self, max_figures=8):
+        self.max_figures = max_figures
+        self._figures = OrderedDict()
+        self.created = 0
+        self.reused = 0
+
+    def _get(self, key, figsize=None, dpi=None):
+        fig = self._figures.pop(key, None)
+        if fig is not None and _pyplot.fignum_exists(fig.number):
+            fig.clear()
+            if figsize is not None:
+                fig.set_size_inches(figsize, forward=True)
+            if dpi is not None:
+                fig.set_dpi(dpi)
+            # make it pyplot's current figure again
+            _pyplot.figure(fig.number)
+            self.reused += 1
+        else:
+            kwargs = {k: v for k, v in (('figsize', figsize), ('dpi', dpi)) if v is not None}
+            fig = _pyplot.figure(**kwargs)
+            self.created += 1
+        self._figures[key] = fig
+        while len(self._figures) > self.max_figures:
+            _, old = self._figures.popitem(last=False)
+            _pyplot.close(old)
+        return fig
+
+    def figure(self, key, num=None, figsize=None, dpi=None, **kwargs):
+        if num is not None or kwargs:
+            # anything but the plain call is left to pyplot
+            return _pyplot.figure(num, figsize=figsize, dpi=dpi, **kwargs)
+        return self._get(key, figsize, dpi)
+
+    def subplots(self, key, nrows=1, ncols=1, **kwargs):
+        subplots_kw, fig_kw = _split_subplots_kwargs(kwargs)
+        figsize, dpi = fig_kw.pop('figsize', None), fig_kw.pop('dpi', None)
+        if fig_kw:
+            return _pyplot.subplots(nrows, ncols, **kwargs)
+        fig = self._get(key, figsize, dpi)
+        return fig, fig.subplots(nrows, ncols, **subplots_kw)
+
+    def close(self):
+        """
+        Close all pooled figures.
+        """
+        while self._figures:
+            _pyplot.close(self._figures.popitem()[1])
+
+    def stats(self):
+        return {'open': len(self._figures), 'created': self.created, 'reused': self.reused,
+                'max_figures': self.max_figures}
+
+
+# WBI_AML_FIGURE_POOL=<max figures> turns the pool on for the whole process
+POOL_ENV_VAR = 'WBI_AML_FIGURE_POOL'
+
+
+def _pool_from_env():
+    max_figures = os.environ.get(POOL_ENV_VAR, '')
+    if max_figures in ('', '0'):
+        return None
+    return FigurePool(int(max_figures))
+
+
+_pool = _pool_from_env()
+
+
+def _pooled(method):
+    def create(*args, **kwargs):
+        # one pooled figure per calling line of code
+        caller = sys._getframe(1)
+        return method((caller.f_code, caller.f_lineno), *args, **kwargs)
+    return create
+
+
+class PyplotProxy:
+    """
+    Stand-in for matplotlib.pyplot used by all plotting helpers.
+
+    Outside of `batch_mode` every attribute is pyplot's own, except that
+    plt.figure and plt.subplots go through the figure pool while one is
+    active. Inside, the helpers draw on standalone Agg figures collected per
+    thread, which are never registered with pyplot, and plt.show() does
+    nothing, so figures can be rendered without a display or any global
+    pyplot state.
+    """
+
+    def __getattr__(self, name):
+        figures = getattr(_local, 'figures', None)
+        if figures is not None:
+            return _batch_attr(figures, name)
+        if _pool is not None and name in ('figure', 'subplots'):
+            return _pooled(getattr(_pool, name))
+        return getattr(_pyplot, name)
+
+    def __repr__(self):
+        return f'<pyplot proxy ({"batch" if getattr(_local, "figures", None) is not None else "pyplot"})>'
+
+
+plt = PyplotProxy()
+
+
+@contextlib.contextmanager
+def batch_mode():
+    """
+    Collect the figures drawn by the plotting helpers inside the with block
+    into the yielded list instead of pyplot:
+
+        with batch_mode() as figures:
+            Exercise4Utils.visualizeBoundary(X, y, clf)
+        figures[0].savefig('boundary.png')
+    """
+    previous = getattr(_local, 'figures', None)
+    _local.figures = figures = []
+    try:
+        yield figures
+    finally:
+        _local.figures = previous
+
+
+@contextlib.contextmanager
+def figure_pool(max_figures=8):
+    """
+    Reuse the figures of the plotting helpers inside the with block, so
+    that calling them in a loop does not allocate a new figure per call:
+
+        with figure_pool() as pool:
+            for w1 in candidates:
+                LinearAlgebraUtils.plot_regression_line(x, y, w0, w1)
+                plt.savefig(...)
+
+    Figures evicted from the pool are closed; the ones still pooled stay
+    open after the block (for display) until pool.close() is called.
+    """
+    global _pool
+    previous = _pool
+    _pool = FigurePool(max_figures)
+    try:
+        yield _pool
+    finally:
+        _pool = previous
+
+
+def _save(figures, path, format=None, dpi=None, **savefig_kwargs):
+    if not figures:
+        return []
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    stem, ext = os.path.splitext(path)
+    if len(figures) == 1:
+        paths = [path]
+    else:
+        paths = [f'{stem}-{i}{ext}' for i in range(len(figures))]
+    for fig, target in zip(figures, paths):
+        fig.savefig(target, format=format, dpi=dpi, **savefig_kwargs)
+    return paths
+
+
+def render(helper, *args, path=None, format=None, dpi=None, **kwargs):
+    """
+    Call the plotting helper `helper(*args, **kwargs)` in batch mode.
+
+    Without `path`, returns the figure it drew (a list if it drew several).
+    With `path`, the figures are written there instead, as PNG, SVG, PDF,
+    ... depending on `format` or the file extension; several figures are
+    numbered path-0.png, path-1.png, ... Returns the list of written files.
+    """
+    with batch_mode() as figures:
+        helper(*args, **kwargs)
+    if path is not None:
+        return _save(figures, path, format=format, dpi=dpi)
+    return figures[0] if len(figures) == 1 else figures
+
+
+def _export_job(job):
+    helper, args, kwargs, path, format, dpi = job
+    return render(helper, *args, path=path, format=format, dpi=dpi, **kwargs)
+
+
+def export_figures(jobs, directory, format='png', dpi=None, n_jobs=None):
+    """
+    Render many figures in parallel, e.g. for grading reports.
+
+    `jobs` is a sequence of (helper, args) or (helper, args, kwargs) tuples,
+    helper being a plotting helper such as Exercise4Utils.visualizeBoundary.
+    Job i is written to <directory>/<i>-<helper name>.<format> by a pool of
+    `n_jobs` processes (all cores by default, n_jobs=1 renders in-process).
+    Returns the list of written files per job, in the order of `jobs`.
+    """
+    width = len(str(max(len(jobs) - 1, 0)))
+    tasks = []
+    for i, job in enumerate(jobs):
+        helper, args, kwargs = (tuple(job) + ({},))[:3]
+        path = os.path.join(directory, f'{i:0{width}d}-{helper.__name__}.{format}')
+        tasks.append((helper, tuple(args), dict(kwargs), path, format, dpi))
+
+    n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+    if n_jobs == 1:
+        return [_export_job(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        chunksize = max(1, len(tasks) // (4 * n_jobs))
+        return list(pool.map(_export_job, tasks, chunksize=chunksize))
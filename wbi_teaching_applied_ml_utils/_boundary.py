@@ -0,0 +1,141 @@
+import numpy as np
+
+from ._instrument import count_calls
+
+
+def _is_vectorized(predict, w, Grid, probe_size=4):
+    # A predictor is treated as vectorized if it maps a block of points to
+    # one prediction per point that agrees with the per-point results
+    probe = Grid[:probe_size]
+    try:
+        batched = np.asarray(predict(w, probe))
+    except Exception:
+        return False
+    if batched.shape != (len(probe),):
+        return False
+    pointwise = [np.ravel(predict(w, pt)) for pt in probe]
+    if any(p.size != 1 for p in pointwise):
+        return False
+    return np.array_equal(np.concatenate(pointwise), batched)
+
+
+def predict_grid(predict, w, Grid, vectorized=None, chunk_size=65536):
+    """
+    Evaluate `predict(w, points)` on all rows of `Grid`.
+
+    Vectorized predictors are called on blocks of `chunk_size` rows at a
+    time to bound memory. Legacy predictors that only accept a single point
+    are called once per row. With vectorized=None, the kind of predictor is
+    detected on a few probe rows.
+    """
+    predict = count_calls(predict)
+    if vectorized is None:
+        vectorized = _is_vectorized(predict, w, Grid)
+    if not vectorized:
+        return np.array([predict(w, pt) for pt in Grid])
+
+    Z = None
+    for start in range(0, len(Grid), chunk_size):
+        block = np.asarray(predict(w, Grid[start:start + chunk_size]))
+        if Z is None:
+            Z = np.empty(len(Grid), dtype=block.dtype)
+        Z[start:start + chunk_size] = block
+    return Z
+
+
+def _node_indices(n, step):
+    idx = np.arange(0, n, step)
+    if idx[-1] != n - 1:
+        idx = np.append(idx, n - 1)
+    return idx
+
+
+def _as_values(prediction):
+    values = np.asarray(prediction)
+    if values.ndim == 2 and values.shape[1] > 1:
+        # class probabilities, e.g. from a softmax output layer
+        return np.argmax(values, axis=1).astype(np.float64)
+    return values.reshape(-1).astype(np.float64)
+
+
+def render_adaptive(predict, xs, ys, coarse_step=8, threshold=0.5):
+    """
+    Evaluate `predict(points)` on the grid spanned by xs and ys, refining
+    only where the predicted class changes.
+
+    The grid is first sampled every `coarse_step` points. Cells (quadtree
+    leaves) whose four corners agree are filled by bilinear interpolation of
+    the corner values (or their common class); all other cells are split in four and their new
+    corner points evaluated in one batched call per level, down to the
+    resolution of the full grid. Continuous outputs (probabilities) are
+    classified with `threshold`. With coarse_step=1 every grid point is
+    evaluated.
+
+    Returns Z of shape (len(ys), len(xs)) and a dict with the number of
+    model evaluations made and saved compared to the dense grid.
+    """
+    predict = count_calls(predict)
+    nx, ny = len(xs), len(ys)
+    Z = np.zeros((ny, nx), dtype=np.float64)
+    known = np.zeros((ny, nx), dtype=bool)
+    stats = {'grid_points': nx * ny, 'evaluations': 0, 'predict_calls': 0, 'levels': 0}
+
+    def evaluate(rows, cols):
+        flat = np.unique(rows * nx + cols)
+        flat = flat[~known.flat[flat]]
+        if flat.size == 0:
+            return
+        r, c = np.divmod(flat, nx)
+        Z[r, c] = _as_values(predict(np.c_[xs[c], ys[r]]))
+        known[r, c] = True
+        stats['evaluations'] += flat.size
+        stats['predict_calls'] += 1
+
+    rows = _node_indices(ny, max(1, coarse_step))
+    cols = _node_indices(nx, max(1, coarse_step))
+    R, C = np.meshgrid(rows, cols, indexing='ij')
+    evaluate(R.ravel(), C.ravel())
+
+    sampled = Z[known]
+    discrete = np.array_equal(sampled, np.round(sampled))
+    labels = (lambda v: v) if discrete else (lambda v: v > threshold)
+
+    # cells as (r0, r1, c0, c1) with inclusive corner indices
+    r0, c0 = np.meshgrid(rows[:-1], cols[:-1], indexing='ij')
+    r1, c1 = np.meshgrid(rows[1:], cols[1:], indexing='ij')
+    cells = np.stack([r0.ravel(), r1.ravel(), c0.ravel(), c1.ravel()], axis=1)
+    if ny == 1 or nx == 1:
+        cells = np.empty((0, 4), dtype=np.intp)
+        evaluate(*np.nonzero(~known))
+
+    while len(cells):
+        stats['levels'] += 1
+        r0, r1, c0, c1 = cells.T
+        corners = [labels(Z[r, c]) for r, c in ((r0, c0), (r0, c1), (r1, c0), (r1, c1))]
+        uniform = np.all([corner == corners[0] for corner in corners[1:]], axis=0)
+        leaf = uniform | ((r1 - r0 <= 1) & (c1 - c0 <= 1))
+
+        for a0, a1, b0, b1 in cells[leaf & uniform]:
+            block = (slice(a0, a1 + 1), slice(b0, b1 + 1))
+            if discrete:
+                fill = Z[a0, b0]
+            else:
+                t = np.linspace(0, 1, a1 - a0 + 1)[:, None]
+                s = np.linspace(0, 1, b1 - b0 + 1)[None, :]
+                fill = ((1 - t) * (1 - s) * Z[a0, b0] + (1 - t) * s * Z[a0, b1]
+                        + t * (1 - s) * Z[a1, b0] + t * s * Z[a1, b1])
+            Z[block] = np.where(known[block], Z[block], fill)
+
+        r0, r1, c0, c1 = cells[~leaf].T
+        rm, cm = (r0 + r1) // 2, (c0 + c1) // 2
+        evaluate(np.concatenate([r0, rm, rm, rm, r1]), np.concatenate([cm, c0, cm, c1, cm]))
+
+        children = []
+        for a0, a1, b0, b1 in ((r0, rm, c0, cm), (r0, rm, cm, c1), (rm, r1, c0, cm), (rm, r1, cm, c1)):
+            child = np.stack([a0, a1, b0, b1], axis=1)
+            # drop degenerate children of cells that are one point thick
+            children.append(child[(a1 > a0) & (b1 > b0)])
+        cells = np.unique(np.concatenate(children), axis=0)
+
+    stats['saved'] = stats['grid_points'] - stats['evaluations']
+    return Z, stats
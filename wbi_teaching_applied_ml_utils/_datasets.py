@@ -0,0 +1,334 @@
+import errno
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+
+import numpy as np
+
+from ._instrument import add_bytes_read
+
+
+def dataset_path(*parts):
+    # all bundled datasets live below <package>/datasets
+    return os.path.join(os.path.dirname(__file__), 'datasets', *parts)
+
+
+def cache_dir():
+    """
+    Root directory for on-disk caches, overridable via WBI_AML_CACHE_DIR.
+    """
+    root = os.environ.get('WBI_AML_CACHE_DIR')
+    if root is None:
+        root = os.path.join(
+            os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+            'wbi_teaching_applied_ml_utils')
+    return root
+
+
+def file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path, obj):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(obj, f)
+    os.replace(tmp, path)
+
+
+def source_hash(path, root=None):
+    """
+    sha256 of `path`, remembered per (size, mtime) so that repeat calls do
+    not have to re-read the whole file.
+    """
+    root = cache_dir() if root is None else root
+    os.makedirs(root, exist_ok=True)
+    st = os.stat(path)
+    stamp_path = os.path.join(root, os.path.basename(path) + '.stamp.json')
+    stamp = read_json(stamp_path)
+    key = [os.path.abspath(path), st.st_size, st.st_mtime_ns]
+    if stamp is not None and stamp.get('key') == key:
+        return stamp['sha256']
+
+    sha = file_hash(path)
+    write_json(stamp_path, {'key': key, 'sha256': sha})
+    return sha
+
+
+def kwargs_tag(kwargs):
+    text = repr(sorted((k, repr(v)) for k, v in kwargs.items()))
+    return hashlib.sha256(text.encode()).hexdigest()[:12]
+
+
+def compiled_path(path, **kwargs):
+    """
+    Location of the binary copy of the text file `path` parsed with `kwargs`.
+    """
+    rel = os.path.relpath(os.path.abspath(path), dataset_path())
+    if rel.startswith(os.pardir):
+        # files outside the package are keyed by their absolute path
+        rel = os.path.join('external', hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:16],
+                           os.path.basename(path))
+    return os.path.join(cache_dir(), 'datasets', f'{rel}.{kwargs_tag(kwargs)}.npy')
+
+
+def compile_text(path, **kwargs):
+    """
+    Parse the text file `path` with np.loadtxt and write it as .npy next to
+    a small json stamp of the source's size and mtime. Returns the path of
+    the binary copy. Object columns are stored as fixed-width strings so the
+    copy can be loaded without pickle.
+    """
+    data = np.loadtxt(path, **kwargs)
+    if data.dtype == object:
+        data = data.astype(str)
+
+    target = compiled_path(path, **kwargs)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        np.save(f, data, allow_pickle=False)
+    os.replace(tmp, target)
+
+    st = os.stat(path)
+    write_json(target + '.json', {'source': [st.st_size, st.st_mtime_ns]})
+    return target
+
+
+def loadtxt_compiled(path, mmap_mode=None, **kwargs):
+    """
+    Drop-in for np.loadtxt(path, **kwargs) that reads a binary .npy copy of
+    the file instead. The copy is (re)built whenever the text file, which
+    stays the source of truth, changes. If the cache directory is not
+    writable the text file is parsed directly.
+    """
+    target = compiled_path(path, **kwargs)
+    st = os.stat(path)
+    stamp = read_json(target + '.json')
+    if stamp is None or stamp.get('source') != [st.st_size, st.st_mtime_ns]:
+        try:
+            compile_text(path, **kwargs)
+        except OSError:
+            data = np.loadtxt(path, **kwargs)
+            return data.astype(str) if data.dtype == object else data
+    return np.load(target, mmap_mode=mmap_mode, allow_pickle=False)
+
+
+def load_npz(path, mmap_mode=None):
+    """
+    Load all arrays of a .npz archive into a dict without unpickling.
+
+    With mmap_mode, members stored uncompressed (np.savez) are memory-mapped
+    in place from the archive instead of being read into memory; compressed
+    members are always read.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            name = info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+            if mmap_mode is None or info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as f:
+                    arrays[name] = np.lib.format.read_array(f, allow_pickle=False)
+                continue
+            with open(path, 'rb') as f:
+                # skip the local file header to the start of the .npy member
+                f.seek(info.header_offset + 26)
+                name_length, extra_length = struct.unpack('<HH', f.read(4))
+                f.seek(name_length + extra_length, os.SEEK_CUR)
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+                if dtype.hasobject:
+                    raise ValueError(f'{info.filename} in {path} contains Python objects')
+                offset = f.tell()
+            if 0 in shape:
+                # np.memmap cannot map empty arrays
+                arrays[name] = np.empty(shape, dtype=dtype)
+                continue
+            arrays[name] = np.memmap(path, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape,
+                                     order='F' if fortran_order else 'C')
+    return arrays
+
+
+# text datasets shipped with the package and how their loaders parse them
+TEXT_DATASETS = [
+    (('linear_algebra', 'salary_data.csv'), dict(skiprows=1, delimiter=",")),
+    (('exercise2', 'ex1data2.txt'), dict(delimiter=',', dtype=np.float64)),
+    (('exercise3', 'ex2data1.txt'), dict(delimiter=',', dtype=np.float64)),
+    (('exercise3', 'ex2data2.txt'), dict(delimiter=',', dtype=np.float64)),
+] + [
+    (('exercise4', name), dict(dtype=np.float64))
+    for name in ('data_1.txt', 'data_2.txt', 'data_3.txt', 'data_4.txt', 'ex6data1.txt',
+                 'ex6data2.txt', 'ex6data3_train.txt', 'ex6data3_val.txt')
+]
+
+
+def compile_datasets():
+    """
+    Build the binary copies of all shipped text datasets ahead of time,
+    e.g. while building a worker image.
+    """
+    return [compile_text(dataset_path(*parts), **kwargs) for parts, kwargs in TEXT_DATASETS]
+
+
+def _freeze(value):
+    # cached arrays are shared between callers and must not be mutated
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _freeze(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    return value
+
+
+def _nbytes(value):
+    if isinstance(value, np.memmap):
+        # memory-mapped arrays are paged in by the OS, not held by the cache
+        return 0
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    return 0
+
+
+class DatasetRegistry:
+    """
+    In-process LRU cache for parsed datasets.
+
+    Entries are keyed by the absolute path, the reader and its keyword
+    arguments, and are re-read when the modification time or size of the
+    file changes. At most `maxsize` entries and `max_bytes` bytes of arrays
+    are kept. Cached arrays are returned read-only.
+    """
+
+    def __init__(self, maxsize=64, max_bytes=512 * 2**20):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(path, reader, kwargs):
+        name = f'{getattr(reader, "__module__", "")}.{getattr(reader, "__qualname__", repr(reader))}'
+        return (os.path.abspath(path), name, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+
+    def load(self, path, reader, **kwargs):
+        """
+        Return `reader(path, **kwargs)`, parsing the file at most once per
+        process as long as it does not change on disk.
+        """
+        key = self._key(path, reader, kwargs)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+
+        add_bytes_read(stamp[1])
+        value = _freeze(reader(path, **kwargs))
+
+        with self._lock:
+            self._entries[key] = (stamp, value, _nbytes(value))
+            self._entries.move_to_end(key)
+            self._evict()
+        return value
+
+    def _evict(self):
+        total = sum(entry[2] for entry in self._entries.values())
+        while self._entries and (len(self._entries) > self.maxsize or total > self.max_bytes):
+            _, (_, _, nbytes) = self._entries.popitem(last=False)
+            total -= nbytes
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': sum(entry[2] for entry in self._entries.values()),
+                'maxsize': self.maxsize,
+                'max_bytes': self.max_bytes,
+            }
+
+
+dataset_registry = DatasetRegistry()
+
+
+def require_datasets(directory, *file_names):
+    """
+    Raise a FileNotFoundError naming every file of datasets/<directory>
+    that is missing, before any of them is loaded.
+    """
+    missing = [name for name in file_names if not os.path.exists(dataset_path(directory, name))]
+    if missing:
+        raise FileNotFoundError(errno.ENOENT, f"missing dataset file(s) {', '.join(missing)}",
+                                dataset_path(directory, missing[0]))
+
+
+def iter_row_blocks(*arrays, block_size=4096):
+    """
+    Yield (rows, blocks) for consecutive slices `rows` of at most
+    `block_size` rows, with blocks = [a[rows] for a in arrays]. The blocks
+    are views, so memory-mapped arrays are only read one block at a time.
+    """
+    n = len(arrays[0])
+    if any(len(a) != n for a in arrays):
+        raise ValueError('all arrays must have the same number of rows')
+    for start in range(0, n, block_size):
+        rows = slice(start, min(start + block_size, n))
+        yield rows, [a[rows] for a in arrays]
+
+
+def load_dataset(reader, *parts, **kwargs):
+    """
+    Load the bundled dataset datasets/<parts...> with `reader` through the
+    registry. Text files read with np.loadtxt are served from their
+    compiled binary copy; pass mmap_mode to memory-map it.
+    """
+    if reader is np.loadtxt:
+        reader = loadtxt_compiled
+    return dataset_registry.load(dataset_path(*parts), reader, **kwargs)
+
+
+if __name__ == '__main__':
+    for target in compile_datasets():
+        print(target)
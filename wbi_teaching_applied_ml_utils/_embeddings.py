@@ -0,0 +1,173 @@
+import io
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from ._datasets import cache_dir, read_json, source_hash, write_json
+from ._instrument import add_bytes_read
+from ._lazy import lazy_import
+
+pd = lazy_import('pandas')
+
+# bump whenever the layout of the cache directory changes
+CACHE_VERSION = 1
+
+
+def decode_embedding_strings(strings, dtype=np.float32):
+    """
+    Decode a sequence of JSON float lists ('[0.1, -0.2, ...]') into a 2d
+    array in one pass of pandas' C float parser instead of per-row json.loads.
+    """
+    strings = pd.Series(strings, dtype=object)
+    if len(strings) == 0:
+        return np.empty((0, 0), dtype=dtype)
+
+    text = strings.str.strip().str.slice(1, -1).str.cat(sep='\n')
+    values = pd.read_csv(io.StringIO(text), header=None, dtype=dtype,
+                         engine='c', skipinitialspace=True, skip_blank_lines=False)
+    return values.to_numpy()
+
+
+def iter_embeddings_csv(path, subset=None, chunksize=4096, dtype=np.float32):
+    """
+    Stream the embeddings CSV in chunks of `chunksize` rows and yield
+    (embeddings, classes, filenames) per chunk. Rows whose class is not in
+    `subset` are dropped before their embedding string is decoded.
+    """
+    reader = pd.read_csv(path, sep=';', compression='gzip', index_col=0,
+                         dtype={'class': object, 'dir': object, 'filename': object, 'embedding': object},
+                         chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            if subset is not None:
+                chunk = chunk[chunk["class"].isin(subset)]
+                if len(chunk) == 0:
+                    continue
+
+            embeddings = decode_embedding_strings(chunk["embedding"], dtype=dtype)
+            classes = chunk["class"].to_numpy().astype(str)
+            filenames = (chunk["dir"] + "/" + chunk["filename"]).to_numpy().astype(str)
+            yield embeddings, classes, filenames
+
+
+def read_embeddings_csv(path, subset=None, chunksize=4096, dtype=np.float32):
+    """
+    Decode the embeddings CSV into (embeddings, classes, filenames), keeping
+    only the rows whose class is in `subset` (all rows if None).
+    """
+    chunks = list(iter_embeddings_csv(path, subset=subset, chunksize=chunksize, dtype=dtype))
+    if not chunks:
+        return (np.empty((0, 0), dtype=dtype),
+                np.empty(0, dtype=str), np.empty(0, dtype=str))
+    return tuple(np.concatenate(parts) for parts in zip(*chunks))
+
+
+def _write_cache(target, source_sha, embeddings, classes, filenames):
+    parent = os.path.dirname(target)
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent, prefix='.building-')
+    try:
+        np.save(os.path.join(tmp, 'embeddings.npy'), np.ascontiguousarray(embeddings, dtype=np.float32))
+        np.save(os.path.join(tmp, 'classes.npy'), classes, allow_pickle=False)
+        np.save(os.path.join(tmp, 'filenames.npy'), filenames, allow_pickle=False)
+        write_json(os.path.join(tmp, 'index.json'), {
+            'version': CACHE_VERSION,
+            'source_sha256': source_sha,
+            'rows': int(embeddings.shape[0]),
+            'dim': int(embeddings.shape[1]),
+        })
+        try:
+            os.rename(tmp, target)
+        except OSError:
+            # another process finished building the same cache first
+            if not os.path.isdir(target):
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _open_cache(target, mmap_mode):
+    index = read_json(os.path.join(target, 'index.json'))
+    if index is None or index.get('version') != CACHE_VERSION:
+        return None
+    try:
+        return tuple(np.load(os.path.join(target, name), mmap_mode=mmap_mode)
+                     for name in ('embeddings.npy', 'classes.npy', 'filenames.npy'))
+    except (OSError, ValueError):
+        return None
+
+
+def _cached_embeddings(path, mmap_mode):
+    # all rows of the binary cache, built first if missing or stale
+    root = cache_dir()
+    sha = source_hash(path, root)
+    name = os.path.basename(path)
+    target = os.path.join(root, f'{name}-{sha[:16]}')
+
+    cached = _open_cache(target, mmap_mode)
+    if cached is None:
+        # stale or corrupt entries for the same source file are replaced
+        shutil.rmtree(target, ignore_errors=True)
+        for entry in os.listdir(root):
+            if entry.startswith(name + '-') and entry != os.path.basename(target):
+                shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+
+        add_bytes_read(os.path.getsize(path))
+        _write_cache(target, sha, *read_embeddings_csv(path))
+        cached = _open_cache(target, mmap_mode)
+    add_bytes_read(sum(a.nbytes for a in cached))
+    return cached
+
+
+def load_embeddings(path, subset=None, use_cache=True, mmap_mode='r'):
+    """
+    Return (embeddings, classes, filenames) for the embeddings CSV at `path`,
+    restricted to the classes in `subset` (all rows if None).
+
+    With `use_cache`, the fully decoded arrays are stored once in a binary
+    cache keyed by the sha256 of the source file and memory-mapped on later
+    calls, so that all worker processes share the same pages. Without it,
+    or if the cache directory is not writable, the CSV is streamed and only
+    the rows of `subset` are decoded.
+    """
+    cached = None
+    if use_cache:
+        try:
+            cached = _cached_embeddings(path, mmap_mode)
+        except OSError:
+            # e.g. a read-only cache directory; parse the csv directly
+            pass
+    if cached is None:
+        add_bytes_read(os.path.getsize(path))
+        return read_embeddings_csv(path, subset=subset)
+
+    if subset is None:
+        return cached
+
+    mask = np.isin(cached[1], subset)
+    return tuple(a[mask] for a in cached)
+
+
+def load_embedding_rows(path, subset=None, use_cache=True, mmap_mode='r'):
+    """
+    Like `load_embeddings`, but without copying the rows of `subset`:
+    returns (embeddings, classes, filenames, rows) with the arrays of all
+    rows in the (memory-mapped) cache and the positions `rows` of the rows
+    in `subset`. Without `use_cache` (or a writable cache directory), only
+    the rows of `subset` are decoded and rows covers all of them.
+    """
+    cached = None
+    if use_cache:
+        try:
+            cached = _cached_embeddings(path, mmap_mode)
+        except OSError:
+            pass
+    if cached is None:
+        embeddings, classes, filenames = load_embeddings(path, subset=subset, use_cache=False)
+        return embeddings, classes, filenames, np.arange(len(classes))
+
+    embeddings, classes, filenames = cached
+    rows = np.arange(len(classes)) if subset is None else np.flatnonzero(np.isin(classes, subset))
+    return embeddings, classes, filenames, rows
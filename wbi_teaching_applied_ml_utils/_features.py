@@ -0,0 +1,71 @@
+import numpy as np
+
+
+def n_poly_features(degree):
+    """
+    Number of columns of map_feature(X1, X2, degree), including the bias.
+    """
+    return (degree + 1) * (degree + 2) // 2
+
+
+def _power_table(x, degree):
+    # table[k] = x**k, built by repeated multiplication, one row per power
+    table = np.empty((degree + 1, x.size), dtype=np.float64)
+    table[0] = 1
+    for k in range(1, degree + 1):
+        np.multiply(table[k - 1], x, out=table[k])
+    return table
+
+
+def _fill(X1, X2, degree, out):
+    P1, P2 = _power_table(X1, degree), _power_table(X2, degree)
+    col = 0
+    for i in range(degree + 1):
+        for j in range(i + 1):
+            np.multiply(P1[i - j], P2[j], out=out[:, col], casting='same_kind')
+            col += 1
+
+
+def map_feature(X1, X2, degree=6, out=None, dtype=np.float64, block_size=65536):
+    """
+    All polynomial terms X1**(i-j) * X2**j of total degree i <= `degree`, in
+    the column order of the exercise (bias first).
+
+    The powers of X1 and X2 are computed once per block of `block_size` rows
+    and multiplied straight into `out`, a preallocated array of shape
+    (len(X1), n_poly_features(degree)), which is allocated with `dtype` if
+    not given. For scalar X1 and X2 a 1 dimensional array is returned.
+    """
+    X1, X2 = np.broadcast_arrays(np.asarray(X1, dtype=np.float64), np.asarray(X2, dtype=np.float64))
+    scalar = X1.ndim == 0
+    X1, X2 = X1.reshape(-1), X2.reshape(-1)
+    shape = (X1.size, n_poly_features(degree))
+
+    if out is None:
+        out = np.empty(shape[1:] if scalar else shape, dtype=dtype)
+    result = out
+    if scalar:
+        out = out.reshape(shape)
+    if out.shape != shape:
+        raise ValueError(f'out should have shape {shape}, got {out.shape}')
+
+    for start in range(0, X1.size, block_size):
+        stop = start + block_size
+        _fill(X1[start:stop], X2[start:stop], degree, out[start:stop])
+    return result
+
+
+def iter_map_feature(X1, X2, degree=6, block_size=65536, dtype=np.float64):
+    """
+    Yield (rows, block) with map_feature(X1[rows], X2[rows], degree) for
+    consecutive slices `rows` of at most `block_size` rows, so that the full
+    expanded matrix is never held in memory. The block buffer is reused, copy
+    it if it has to outlive the next iteration.
+    """
+    X1, X2 = np.broadcast_arrays(np.atleast_1d(X1), np.atleast_1d(X2))
+    buffer = np.empty((min(block_size, len(X1)), n_poly_features(degree)), dtype=dtype)
+    for start in range(0, len(X1), block_size):
+        rows = slice(start, min(start + block_size, len(X1)))
+        block = buffer[:rows.stop - rows.start]
+        _fill(np.asarray(X1[rows], dtype=np.float64), np.asarray(X2[rows], dtype=np.float64), degree, block)
+        yield rows, block
@@ -0,0 +1,193 @@
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from ._datasets import cache_dir
+from ._instrument import add_bytes_read, in_calling_thread
+from ._lazy import lazy_import
+
+requests = lazy_import('requests')
+Image = lazy_import('PIL.Image')
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session(pool_size=16):
+    """
+    Process-wide requests.Session with a connection pool, so that repeated
+    fetches from the same host reuse their TCP connections.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class ImageCache:
+    """
+    Content-addressed on-disk cache for downloaded images.
+
+    Blobs are stored under objects/ by the sha256 of their content and
+    refs/ maps the sha256 of each url to its blob. The modification time of
+    a blob is bumped on every hit and the least recently used blobs are
+    evicted once the cache grows beyond `max_bytes`.
+    """
+
+    def __init__(self, root=None, max_bytes=512 * 2**20):
+        self.root = os.path.join(cache_dir(), 'images') if root is None else root
+        self.max_bytes = max_bytes
+        self._objects = os.path.join(self.root, 'objects')
+        self._refs = os.path.join(self.root, 'refs')
+        os.makedirs(self._objects, exist_ok=True)
+        os.makedirs(self._refs, exist_ok=True)
+
+    def _ref_path(self, url):
+        return os.path.join(self._refs, _sha256(url.encode()))
+
+    def get(self, url):
+        try:
+            with open(self._ref_path(url)) as f:
+                blob = os.path.join(self._objects, f.read().strip())
+            with open(blob, 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(blob)
+        except OSError:
+            pass
+        return content
+
+    def _write_atomic(self, path, data, mode):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, mode) as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def put(self, url, content):
+        # caching is best effort; a full or read-only disk only costs the
+        # download on the next call
+        digest = _sha256(content)
+        blob = os.path.join(self._objects, digest)
+        try:
+            if os.path.exists(blob):
+                os.utime(blob)
+            else:
+                self._write_atomic(blob, content, 'wb')
+            self._write_atomic(self._ref_path(url), digest, 'w')
+        except OSError:
+            pass
+
+    def size(self):
+        return sum(entry.stat().st_size for entry in os.scandir(self._objects) if entry.is_file())
+
+    def evict(self):
+        """
+        Remove least recently used blobs until the cache fits into `max_bytes`.
+        Refs to evicted blobs are treated as misses by `get`.
+        """
+        entries = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                   for e in os.scandir(self._objects) if e.is_file() and not e.name.endswith('.tmp')]
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        for directory in (self._objects, self._refs):
+            for entry in os.scandir(directory):
+                os.remove(entry.path)
+
+
+_default_cache = None
+
+
+def default_cache():
+    """
+    The process-wide ImageCache, or None if the cache directory cannot be
+    created (e.g. it is read-only), in which case images are not cached.
+    """
+    global _default_cache
+    if _default_cache is None:
+        max_mb = float(os.environ.get('WBI_AML_IMAGE_CACHE_MB', 512))
+        try:
+            _default_cache = ImageCache(max_bytes=int(max_mb * 2**20))
+        except OSError:
+            return None
+    return _default_cache
+
+
+def _decode(content):
+    img = Image.open(BytesIO(content))
+    img.load()
+    return img
+
+
+def _download(url, cache, offline, timeout):
+    content = cache.get(url) if cache is not None else None
+    cached = content is not None
+    if content is None and not offline:
+        try:
+            response = get_session().get(url, timeout=timeout)
+        except requests.RequestException:
+            return None
+        if response.status_code != 200:
+            return None
+        content = response.content
+    if content is None:
+        return None
+    add_bytes_read(len(content))
+
+    try:
+        img = _decode(content)
+    except OSError:
+        # not an image (PIL.UnidentifiedImageError), e.g. an HTML error
+        # page served with status 200, or a truncated body
+        return None
+    # only decodable images are cached
+    if cache is not None and not cached:
+        cache.put(url, content)
+    return img
+
+
+def fetch_images(urls, cache=None, offline=False, max_workers=8, timeout=30):
+    """
+    Fetch and decode the images at `urls` in parallel.
+
+    Returns a list of PIL images in the order of `urls`, with None for
+    images that could not be fetched or decoded. With `offline`, only the
+    disk cache is consulted. Pass `cache=False` to bypass the disk cache.
+    """
+    if cache is None:
+        cache = default_cache()
+    elif cache is False:
+        cache = None
+    unique = list(dict.fromkeys(urls))
+    workers = max(1, min(max_workers, len(unique)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        download = in_calling_thread(lambda url: _download(url, cache, offline, timeout))
+        images = dict(zip(unique, pool.map(download, unique)))
+    if not offline and cache is not None:
+        try:
+            cache.evict()
+        except OSError:
+            pass
+    return [images[url] for url in urls]
@@ -0,0 +1,230 @@
+import contextlib
+import functools
+import inspect
+import os
+import threading
+import time
+import tracemalloc
+
+# WBI_AML_PROFILE=1 records into `session_profile` for the whole process,
+# WBI_AML_PROFILE=time does the same without tracing allocations
+ENV_VAR = 'WBI_AML_PROFILE'
+
+_lock = threading.RLock()
+_profiles = []
+# stack of the running instrumented calls, per thread
+_local = threading.local()
+
+# tracemalloc.reset_peak is new in Python 3.9; without it, the peak of a
+# call is approximated by the traced memory at its start and end
+_HAS_RESET_PEAK = hasattr(tracemalloc, 'reset_peak')
+
+
+def _frames():
+    frames = getattr(_local, 'frames', None)
+    if frames is None:
+        frames = _local.frames = []
+    return frames
+
+
+def _peak():
+    current, peak = tracemalloc.get_traced_memory()
+    return peak if _HAS_RESET_PEAK else current
+
+
+class Profile:
+    """
+    Statistics of the instrumented helpers called while the profile was
+    active, per qualified name: call count, wall time, bytes read from disk
+    or network, model predict calls and the peak of traced allocations
+    (None when allocations are not traced). Nested helpers are counted
+    inclusively, e.g. a plot that loads data includes the bytes read.
+    """
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.stats = {}
+
+    def _record(self, name, seconds, bytes_read, predict_calls, peak_bytes):
+        entry = self.stats.setdefault(name, {
+            'calls': 0, 'seconds': 0.0, 'bytes_read': 0, 'predict_calls': 0, 'peak_bytes': None})
+        entry['calls'] += 1
+        entry['seconds'] += seconds
+        entry['bytes_read'] += bytes_read
+        entry['predict_calls'] += predict_calls
+        if peak_bytes is not None:
+            entry['peak_bytes'] = max(entry['peak_bytes'] or 0, peak_bytes)
+
+    def as_dict(self):
+        with _lock:
+            return {name: dict(entry) for name, entry in self.stats.items()}
+
+    def report(self, sort_by='seconds'):
+        """
+        The statistics as a list of dicts with a 'name' key, slowest (or
+        largest `sort_by`) first.
+        """
+        rows = [{'name': name, **entry} for name, entry in self.as_dict().items()]
+        return sorted(rows, key=lambda row: row[sort_by] or 0, reverse=True)
+
+    def reset(self):
+        with _lock:
+            self.stats.clear()
+
+
+def _session_profile():
+    mode = os.environ.get(ENV_VAR, '')
+    if mode in ('', '0'):
+        return None
+    profile = Profile(trace_memory=mode != 'time')
+    _profiles.append(profile)
+    return profile
+
+
+session_profile = _session_profile()
+
+
+@contextlib.contextmanager
+def profile(trace_memory=True):
+    """
+    Record the instrumented helpers called inside the with block:
+
+        with profile() as p:
+            Exercise4Utils.visualizeBoundary(X, y, clf)
+        p.report()
+
+    Tracing allocations with tracemalloc slows numpy-heavy code down
+    noticeably; pass trace_memory=False for wall times only.
+    """
+    p = Profile(trace_memory=trace_memory)
+    with _lock:
+        _profiles.append(p)
+    try:
+        yield p
+    finally:
+        with _lock:
+            _profiles.remove(p)
+
+
+def _add(key, n):
+    frames = _frames()
+    with _lock:
+        for frame in frames:
+            frame[key] += n
+
+
+def add_bytes_read(n):
+    if _profiles:
+        _add('bytes_read', n)
+
+
+def add_predict_calls(n=1):
+    if _profiles:
+        _add('predict_calls', n)
+
+
+def in_calling_thread(fn):
+    """
+    `fn`, recording the bytes read and predict calls into the instrumented
+    calls running in the calling thread, for work handed to worker threads.
+    """
+    frames = list(_frames())
+    if not frames:
+        return fn
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        previous = getattr(_local, 'frames', None)
+        _local.frames = list(frames)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _local.frames = previous
+    return run
+
+
+def count_calls(predict):
+    """
+    `predict`, counting its calls into the running profiles.
+    """
+    if not _profiles:
+        return predict
+
+    @functools.wraps(predict)
+    def counted(*args, **kwargs):
+        add_predict_calls(1)
+        return predict(*args, **kwargs)
+    return counted
+
+
+def _run(name, fn, args, kwargs):
+    with _lock:
+        profiles = list(_profiles)
+    trace = any(p.trace_memory for p in profiles)
+    started_tracing = trace and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    frames = _frames()
+    frame = {'bytes_read': 0, 'predict_calls': 0, 'base': 0, 'peak': 0}
+    if trace:
+        with _lock:
+            if frames:
+                # keep the parent's peak before resetting it for this call
+                frames[-1]['peak'] = max(frames[-1]['peak'], _peak())
+            if _HAS_RESET_PEAK:
+                tracemalloc.reset_peak()
+            frame['base'] = frame['peak'] = tracemalloc.get_traced_memory()[0]
+    frames.append(frame)
+
+    start = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - start
+        peak = None
+        frames.remove(frame)
+        with _lock:
+            if trace:
+                frame['peak'] = max(frame['peak'], _peak())
+                peak = frame['peak'] - frame['base']
+                if frames:
+                    frames[-1]['peak'] = max(frames[-1]['peak'], frame['peak'])
+            for p in profiles:
+                p._record(name, seconds, frame['bytes_read'], frame['predict_calls'],
+                          peak if p.trace_memory else None)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def instrumented(name):
+    """
+    Decorator recording the calls of a function under `name` while a
+    profile is active; otherwise the function is called directly.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _profiles:
+                return fn(*args, **kwargs)
+            return _run(name, fn, args, kwargs)
+        return wrapper
+    return decorate
+
+
+def instrument_class(cls):
+    """
+    Class decorator instrumenting all public (static) methods of a utility
+    class under '<class>.<method>'. Generators and nested classes are left
+    alone.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith('_'):
+            continue
+        static = isinstance(value, staticmethod)
+        fn = value.__func__ if static else value
+        if not inspect.isfunction(fn) or inspect.isgeneratorfunction(fn):
+            continue
+        wrapped = instrumented(f'{cls.__name__}.{attr}')(fn)
+        setattr(cls, attr, staticmethod(wrapped) if static else wrapped)
+    return cls
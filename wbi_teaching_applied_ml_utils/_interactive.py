@@ -0,0 +1,89 @@
+import time
+
+
+class BlitManager:
+    """
+    Redraw only a few animated artists of a figure instead of the whole
+    figure, for interactive plots that have to stay responsive in remote
+    (e.g. Jupyter) sessions.
+
+    The static part of the figure is rendered once and cached as the
+    background on every full draw. `update()` restores the background,
+    draws the registered artists on top of it and blits the result. Bursts
+    of updates, e.g. while a slider is dragged, are coalesced into at most
+    one redraw per `min_interval` seconds. Canvases without blitting
+    support fall back to draw_idle.
+    """
+
+    def __init__(self, fig, artists=(), min_interval=1 / 30):
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.min_interval = min_interval
+        self._artists = []
+        self._background = None
+        self._last_draw = -float('inf')
+        self._timer = None
+        self._pending = False
+        for artist in artists:
+            self.add_artist(artist)
+        self._cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def add_artist(self, artist):
+        # animated artists are left out of the full draw, i.e. the background
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+    def _on_draw(self, event):
+        if event is not None and event.canvas is not self.canvas:
+            return
+        if self.canvas.is_saving():
+            # savefig draws the animated artists itself and renders at its
+            # own dpi, which is no background for the screen
+            return
+        if self.canvas.supports_blit:
+            self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self._artists:
+            self.fig.draw_artist(artist)
+
+    def _redraw(self):
+        self._pending = False
+        self._last_draw = time.monotonic()
+        if self._background is None or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
+
+    def _on_timer(self):
+        if self._pending:
+            self._redraw()
+
+    def update(self):
+        """
+        Request a redraw of the animated artists, throttled to one redraw
+        per `min_interval` seconds; the last request of a burst is always
+        drawn.
+        """
+        wait = self.min_interval - (time.monotonic() - self._last_draw)
+        if wait <= 0:
+            self._redraw()
+            return
+        self._pending = True
+        if self._timer is None:
+            self._timer = self.canvas.new_timer(interval=max(1, int(1000 * wait)))
+            self._timer.single_shot = True
+            self._timer.add_callback(self._on_timer)
+        else:
+            self._timer.stop()
+            self._timer.interval = max(1, int(1000 * wait))
+        self._timer.start()
+
+    def disconnect(self):
+        self.canvas.mpl_disconnect(self._cid)
+        if self._timer is not None:
+            self._timer.stop()
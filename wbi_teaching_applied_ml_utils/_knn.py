@@ -0,0 +1,174 @@
+import numpy as np
+
+
+def _topk(distances, k):
+    # k smallest entries per row, sorted by distance
+    k = min(k, distances.shape[1])
+    if k < distances.shape[1]:
+        idx = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    else:
+        idx = np.broadcast_to(np.arange(distances.shape[1]), distances.shape).copy()
+    part = np.take_along_axis(distances, idx, axis=1)
+    order = np.argsort(part, axis=1, kind='stable')
+    return np.take_along_axis(part, order, axis=1), np.take_along_axis(idx, order, axis=1)
+
+
+def _gather(values, indices):
+    # values[indices], with None for missing neighbours (index -1)
+    gathered = values[indices]
+    missing = indices < 0
+    if missing.any():
+        gathered = gathered.astype(object)
+        gathered[missing] = None
+    return gathered
+
+
+class KNNIndex:
+    """
+    Brute-force k-nearest-neighbour index over the rows of `x`.
+
+    Distances are computed block-wise with one matrix product per block of
+    queries, so that memory stays within `memory_budget` bytes, and the k
+    best candidates are selected with argpartition. metric is 'cosine'
+    (1 - cosine similarity) or 'l2' (euclidean distance).
+
+    With approximate=True, an inverted file index is built: the rows are
+    clustered into `n_lists` buckets by k-means and a query only scans the
+    `n_probe` buckets with the closest centroids.
+    """
+
+    def __init__(self, x, filenames=None, labels=None, metric='cosine',
+                 approximate=False, n_lists=None, n_probe=8, memory_budget=64 * 2**20,
+                 random_state=47):
+        if metric not in ('cosine', 'l2'):
+            raise ValueError(f"metric must be 'cosine' or 'l2', got {metric!r}")
+
+        self.metric = metric
+        self.memory_budget = memory_budget
+        self.filenames = None if filenames is None else np.asarray(filenames)
+        self.labels = None if labels is None else np.asarray(labels)
+
+        x = np.asarray(x, dtype=np.float32)
+        if x.ndim != 2:
+            raise ValueError('x should be a 2 dimensional array')
+        if metric == 'cosine':
+            x = self._normalize(x)
+        self._x = np.ascontiguousarray(x)
+        self._sq_norms = np.einsum('ij,ij->i', self._x, self._x)
+
+        self.approximate = approximate
+        self.n_probe = n_probe
+        if approximate:
+            n_lists = int(np.sqrt(len(x))) if n_lists is None else n_lists
+            self._build_ivf(max(1, min(n_lists, len(x))), random_state)
+
+    def __len__(self):
+        return self._x.shape[0]
+
+    @staticmethod
+    def _normalize(x):
+        norms = np.linalg.norm(x, axis=1, keepdims=True)
+        return x / np.maximum(norms, np.finfo(np.float32).tiny)
+
+    def _distances(self, queries, x, sq_norms):
+        dots = queries @ x.T
+        if self.metric == 'cosine':
+            return 1 - dots
+        q_norms = np.einsum('ij,ij->i', queries, queries)
+        d = q_norms[:, None] - 2 * dots + sq_norms[None, :]
+        np.maximum(d, 0, out=d)
+        return d
+
+    def _prepare(self, queries):
+        queries = np.asarray(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None]
+        if self.metric == 'cosine':
+            queries = self._normalize(queries)
+        return queries
+
+    def _finish(self, distances):
+        if self.metric == 'l2':
+            return np.sqrt(distances)
+        return distances
+
+    def _block_size(self, n_columns):
+        return max(1, int(self.memory_budget // (4 * max(1, n_columns))))
+
+    def _build_ivf(self, n_lists, random_state, n_iter=10):
+        rng = np.random.default_rng(random_state)
+        x = self._x
+        centroids = x[rng.choice(len(x), n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            assign = self._assign(centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, x)
+            counts = np.bincount(assign, minlength=n_lists)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+
+        assign = self._assign(centroids)
+        self._centroids = centroids
+        self._list_order = np.argsort(assign, kind='stable')
+        self._list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=n_lists))])
+
+    def _assign(self, centroids):
+        c_norms = np.einsum('ij,ij->i', centroids, centroids)
+        assign = np.empty(len(self._x), dtype=np.intp)
+        step = self._block_size(len(centroids))
+        for start in range(0, len(self._x), step):
+            block = self._x[start:start + step]
+            d = c_norms[None, :] - 2 * (block @ centroids.T)
+            assign[start:start + step] = np.argmin(d, axis=1)
+        return assign
+
+    def search(self, queries, k=10):
+        """
+        Return (distances, indices) of the k nearest rows for every query,
+        each of shape (n_queries, k) and sorted by increasing distance.
+        In approximate mode, missing neighbours have index -1 and distance inf.
+        """
+        queries = self._prepare(queries)
+        if self.approximate:
+            return self._search_ivf(queries, k)
+
+        k = min(k, len(self))
+        distances = np.empty((len(queries), k), dtype=np.float32)
+        indices = np.empty((len(queries), k), dtype=np.intp)
+        step = self._block_size(len(self))
+        for start in range(0, len(queries), step):
+            block = self._distances(queries[start:start + step], self._x, self._sq_norms)
+            d, i = _topk(block, k)
+            distances[start:start + step] = d
+            indices[start:start + step] = i
+        return self._finish(distances), indices
+
+    def _search_ivf(self, queries, k):
+        n_probe = min(self.n_probe, len(self._centroids))
+        c_norms = np.einsum('ij,ij->i', self._centroids, self._centroids)
+        probes = _topk(c_norms[None, :] - 2 * (queries @ self._centroids.T), n_probe)[1]
+
+        distances = np.full((len(queries), k), np.inf, dtype=np.float32)
+        indices = np.full((len(queries), k), -1, dtype=np.intp)
+        for q, lists in enumerate(probes):
+            candidates = np.concatenate([
+                self._list_order[self._list_offsets[l]:self._list_offsets[l + 1]] for l in lists])
+            if len(candidates) == 0:
+                continue
+            d = self._distances(queries[q:q + 1], self._x[candidates], self._sq_norms[candidates])
+            d, i = _topk(d, k)
+            distances[q, :d.shape[1]] = d[0]
+            indices[q, :d.shape[1]] = candidates[i[0]]
+        return self._finish(distances), indices
+
+    def query(self, queries, k=10):
+        """
+        Like `search`, but returns (distances, indices, filenames, labels)
+        with the filenames and labels of the neighbours (None if the index
+        was built without them). Missing neighbours of the approximate
+        search have the filename and label None.
+        """
+        distances, indices = self.search(queries, k)
+        filenames = None if self.filenames is None else _gather(self.filenames, indices)
+        labels = None if self.labels is None else _gather(self.labels, indices)
+        return distances, indices, filenames, labels
@@ -0,0 +1,32 @@
+import numpy as np
+
+
+def mse(x, y, w0, w1):
+    """
+    Batched mean squared error of the lines w0 + w1 * x, one per entry of
+    the 1d arrays w0 and w1.
+    """
+    residuals = w0[:, None] + w1[:, None] * x[None, :] - y[None, :]
+    return np.einsum('ij,ij->i', residuals, residuals) / x.shape[0]
+
+
+def loss_surface(x, y, w0_vals, w1_vals, loss=mse, memory_budget=64 * 2**20):
+    """
+    Evaluate `loss` for every (w0, w1) pair of the broadcast arrays w0_vals
+    and w1_vals, e.g. the output of np.meshgrid.
+
+    `loss(x, y, w0, w1)` receives 1d arrays holding a chunk of pairs, the
+    intercepts w0 before the slopes w1, and returns one loss per pair. Chunks are sized so that a (chunk, len(x))
+    float64 intermediate fits into `memory_budget` bytes.
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    W0, W1 = np.broadcast_arrays(np.asarray(w0_vals, dtype=np.float64),
+                                 np.asarray(w1_vals, dtype=np.float64))
+    w0, w1 = W0.ravel(), W1.ravel()
+
+    L = np.empty(w0.size, dtype=np.float64)
+    step = max(1, int(memory_budget // (8 * max(1, x.size))))
+    for start in range(0, w0.size, step):
+        L[start:start + step] = loss(x, y, w0[start:start + step], w1[start:start + step])
+    return L.reshape(W0.shape)
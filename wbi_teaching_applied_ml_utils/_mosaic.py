@@ -0,0 +1,84 @@
+import numpy as np
+
+from ._batch import plt
+
+
+def sample_indices(m, k, replace=False):
+    """
+    k random row indices out of m, drawn from the global numpy random state
+    exactly like np.random.randint(m) k times (with replacement) or
+    np.random.choice(m, k, replace=False), so seeded notebooks keep showing
+    the same rows in the same order.
+    """
+    if replace:
+        return np.random.randint(m, size=k)
+    return np.random.choice(m, k, replace=False)
+
+
+def take_rows(X, index):
+    """
+    X[index], reading the rows in increasing order so that a memory-mapped
+    X is read front to back, returned in the order of `index`.
+    """
+    index = np.asarray(index)
+    order = np.argsort(index, kind='stable')
+    rows = np.asarray(X[index[order]])
+    # undo the sort
+    out = np.empty_like(rows)
+    out[order] = rows
+    return out
+
+
+def tile_images(images, rows, cols, pad=1, normalize=True):
+    """
+    Tile a stack of images of shape (n, height, width), n <= rows * cols,
+    into one (rows, cols) mosaic separated by `pad` pixels of NaN (drawn
+    transparent by imshow); pad may also be (pad_y, pad_x). With
+    `normalize`, every image is scaled to [0, 1] by its own range, like
+    separate imshow calls would do.
+    """
+    images = np.asarray(images, dtype=np.float64)
+    n, h, w = images.shape
+    pad_y, pad_x = np.broadcast_to(np.asarray(pad, dtype=int), (2,))
+    if n > rows * cols:
+        raise ValueError(f'{n} images do not fit into a {rows}x{cols} mosaic')
+    if normalize and n:
+        lo = images.min(axis=(1, 2), keepdims=True)
+        span = images.max(axis=(1, 2), keepdims=True) - lo
+        images = (images - lo) / np.where(span > 0, span, 1)
+
+    tiles = np.full((rows * cols, h, w), np.nan)
+    tiles[:n] = images
+    grid = np.full((rows, h + pad_y, cols, w + pad_x), np.nan)
+    grid[:, :h, :, :w] = tiles.reshape(rows, cols, h, w).transpose(0, 2, 1, 3)
+    grid = grid.reshape(rows * (h + pad_y), cols * (w + pad_x))
+    return grid[:grid.shape[0] - pad_y, :grid.shape[1] - pad_x]
+
+
+def plot_mosaic(images, rows, cols, labels=None, cmap='gray', figsize=(5, 5), title=None, pad=1):
+    """
+    Draw a stack of images as one mosaic with a single imshow call and
+    `labels` as text above every tile. Returns the figure.
+    """
+    images = np.asarray(images)
+    n, h, w = images.shape
+    # leave room for a line of text above every row of tiles
+    pad_y = pad if labels is None else pad + h // 2
+    mosaic = tile_images(images, rows, cols, pad=(pad_y, pad))
+
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.imshow(mosaic, cmap=cmap, interpolation='nearest')
+    ax.set_axis_off()
+
+    if labels is not None:
+        ax.set_ylim(mosaic.shape[0] - 0.5, -pad_y - 0.5)
+        tile = np.arange(n)
+        # text in data coordinates, just above the top center of each tile
+        xs = (tile % cols) * (w + pad) + (w - 1) / 2
+        ys = (tile // cols) * (h + pad_y) - 0.5
+        for x, y, label in zip(xs, ys, labels):
+            ax.text(x, y, str(label), ha='center', va='bottom', fontsize=8)
+    if title is not None:
+        fig.suptitle(title, fontsize=14)
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,118 @@
+import numpy as np
+
+
+def _sigmoid(z):
+    # numerically stable in place version of 1 / (1 + exp(-z))
+    e = np.exp(-np.abs(z))
+    np.divide(np.where(z >= 0, 1, e), 1 + e, out=z)
+    return z
+
+
+def _relu(z):
+    return np.maximum(z, 0, out=z)
+
+
+def _linear(z):
+    return z
+
+
+def _softmax(z):
+    z -= z.max(axis=1, keepdims=True)
+    np.exp(z, out=z)
+    z /= z.sum(axis=1, keepdims=True)
+    return z
+
+
+ACTIVATIONS = {'sigmoid': _sigmoid, 'relu': _relu, 'linear': _linear, 'softmax': _softmax}
+
+
+class DenseNetwork:
+    """
+    Batched forward pass of a fully connected network, e.g. the two-layer
+    network of exercise 5:
+
+        net = DenseNetwork(*Exercise5Utils.load_weights_task1())
+        probabilities = net.forward(X)
+
+    The weights are given as W1, b1, W2, b2, ... with Wi of shape
+    (n_in, n_out). `activations` names the activation of every layer
+    ('sigmoid', 'relu', 'linear' or 'softmax'); by default the hidden layers
+    use sigmoid and the output layer softmax.
+
+    Inputs are processed `batch_size` rows at a time in `dtype`, reusing the
+    same intermediate buffers for every batch, so that scoring a large
+    image batch only allocates the output. An instance is therefore not
+    safe to share between threads.
+    """
+
+    def __init__(self, *weights, activations=None, dtype=np.float32, batch_size=1024):
+        if len(weights) == 0 or len(weights) % 2:
+            raise ValueError('weights should be given as W1, b1, W2, b2, ...')
+        self.dtype = np.dtype(dtype)
+        self.batch_size = batch_size
+        # no copy if the (memory-mapped) weights already have the right dtype
+        self.weights = [np.asarray(W, dtype=self.dtype) for W in weights[0::2]]
+        self.biases = [np.asarray(b, dtype=self.dtype).reshape(-1) for b in weights[1::2]]
+        for i, (W, b) in enumerate(zip(self.weights, self.biases), 1):
+            if W.ndim != 2 or b.shape != (W.shape[1],):
+                raise ValueError(f'layer {i}: W should be (n_in, n_out) and b (n_out,), '
+                                 f'got {W.shape} and {b.shape}')
+            if i > 1 and W.shape[0] != self.weights[i - 2].shape[1]:
+                raise ValueError(f'layer {i}: expected {self.weights[i - 2].shape[1]} inputs, got {W.shape[0]}')
+
+        if activations is None:
+            activations = ['sigmoid'] * (len(self.weights) - 1) + ['softmax']
+        if len(activations) != len(self.weights):
+            raise ValueError(f'expected {len(self.weights)} activations, got {len(activations)}')
+        unknown = set(activations) - set(ACTIVATIONS)
+        if unknown:
+            raise ValueError(f'unknown activations {sorted(unknown)}, choose from {sorted(ACTIVATIONS)}')
+        self.activations = list(activations)
+        self._buffers = None
+
+    @property
+    def n_inputs(self):
+        return self.weights[0].shape[0]
+
+    @property
+    def n_outputs(self):
+        return self.weights[-1].shape[1]
+
+    def _get_buffers(self):
+        # one buffer per hidden layer, sized for a full batch
+        if self._buffers is None or self._buffers[0] != self.batch_size:
+            self._buffers = (self.batch_size, [np.empty((self.batch_size, W.shape[1]), dtype=self.dtype)
+                                               for W in self.weights[:-1]])
+        return self._buffers[1]
+
+    def forward(self, X, out=None):
+        """
+        Output activations for every row of X, which may also be a stack of
+        images of shape (n, height, width). Pass a preallocated `out` of
+        shape (n, n_outputs) to reuse it between calls.
+        """
+        X = np.asarray(X)
+        X = X.reshape(len(X), -1)
+        if X.shape[1] != self.n_inputs:
+            raise ValueError(f'expected {self.n_inputs} features per row, got {X.shape[1]}')
+        if out is None:
+            out = np.empty((len(X), self.n_outputs), dtype=self.dtype)
+        elif out.shape != (len(X), self.n_outputs):
+            raise ValueError(f'out should have shape {(len(X), self.n_outputs)}, got {out.shape}')
+
+        buffers = self._get_buffers()
+        for start in range(0, len(X), self.batch_size):
+            stop = min(start + self.batch_size, len(X))
+            a = np.asarray(X[start:stop], dtype=self.dtype)
+            targets = [buffer[:stop - start] for buffer in buffers] + [out[start:stop]]
+            for W, b, activation, z in zip(self.weights, self.biases, self.activations, targets):
+                np.matmul(a, W, out=z)
+                z += b
+                a = ACTIVATIONS[activation](z)
+        return out
+
+    def predict(self, X):
+        """
+        Index of the largest output for every row of X.
+        """
+        return np.argmax(self.forward(X), axis=1)
@@ -0,0 +1,119 @@
+import numpy as np
+
+
+class PolynomialSweep:
+    """
+    Least-squares polynomial fits of several degrees, as returned by
+    `polynomial_sweep`.
+
+    predictions[i], train_predictions[i] and test_predictions[i] hold the
+    fit of degree degrees[i] evaluated at x_eval, x_train and x_test.
+    """
+
+    def __init__(self, degrees, x_eval, predictions, train_predictions, test_predictions,
+                 y_train, y_test):
+        self.degrees = np.asarray(degrees)
+        self.x_eval = x_eval
+        self.predictions = predictions
+        self.train_predictions = train_predictions
+        self.test_predictions = test_predictions
+        self.mse_train = np.mean((train_predictions - y_train) ** 2, axis=1)
+        self.mse_test = (None if y_test is None or test_predictions is None
+                         else np.mean((test_predictions - y_test) ** 2, axis=1))
+
+    @property
+    def rmse_train(self):
+        return np.sqrt(self.mse_train)
+
+    @property
+    def rmse_test(self):
+        return None if self.mse_test is None else np.sqrt(self.mse_test)
+
+
+def polynomial_sweep(x_train, y_train, degrees, x_eval=None, x_test=None, y_test=None):
+    """
+    Fit polynomials of all `degrees` (an int d means 1..d) to (x_train,
+    y_train) in a single pass.
+
+    The basis is built one degree at a time: the next column is x times the
+    previous orthonormal column, orthogonalized (twice, for stability)
+    against all earlier ones, i.e. an updated QR factorization of the
+    Vandermonde matrix. Each degree then only adds one projection to the
+    previous fit, and the same recurrence evaluates the basis at x_eval and
+    x_test without ever forming or solving a normal equation.
+    """
+    if y_test is not None and x_test is None:
+        raise ValueError('y_test was given without x_test')
+    degrees = np.arange(1, degrees + 1) if np.ndim(degrees) == 0 else np.asarray(degrees)
+    max_degree = int(degrees.max())
+
+    x = np.asarray(x_train, dtype=np.float64).ravel()
+    y = np.asarray(y_train, dtype=np.float64).ravel()
+    n = x.size
+
+    # map the training range to [-1, 1] to keep the basis well conditioned
+    center = (x.max() + x.min()) / 2
+    scale = (x.max() - x.min()) / 2 or 1.0
+
+    def scaled(values):
+        return None if values is None else (np.asarray(values, dtype=np.float64).ravel() - center) / scale
+
+    t = scaled(x)
+    others = [scaled(x_eval), scaled(x_test)]
+
+    Q = np.empty((n, max_degree + 1))
+    Q[:, 0] = 1 / np.sqrt(n)
+    B = [None if o is None else np.empty((o.size, max_degree + 1)) for o in others]
+    for b in B:
+        if b is not None:
+            b[:, 0] = 1 / np.sqrt(n)
+
+    c = Q[:, 0] @ y
+    fit = c * Q[:, 0]
+    fit_others = [None if b is None else c * b[:, 0] for b in B]
+
+    wanted = set(degrees.tolist())
+    results = {0: (fit.copy(), [None if f is None else f.copy() for f in fit_others])}
+    for k in range(1, max_degree + 1):
+        v = t * Q[:, k - 1]
+        h = np.zeros(k)
+        for _ in range(2):
+            correction = Q[:, :k].T @ v
+            v -= Q[:, :k] @ correction
+            h += correction
+        norm = np.linalg.norm(v)
+
+        if norm <= 1e-12 * np.sqrt(n):
+            # more coefficients than distinct points: the fit cannot improve
+            Q[:, k] = 0
+            for b in B:
+                if b is not None:
+                    b[:, k] = 0
+        else:
+            Q[:, k] = v / norm
+            for o, b in zip(others, B):
+                if b is not None:
+                    b[:, k] = (o * b[:, k - 1] - b[:, :k] @ h) / norm
+
+            c = Q[:, k] @ y
+            fit += c * Q[:, k]
+            for f, b in zip(fit_others, B):
+                if f is not None:
+                    f += c * b[:, k]
+
+        if k in wanted:
+            results[k] = (fit.copy(), [None if f is None else f.copy() for f in fit_others])
+
+    def stack(pick):
+        rows = [pick(results[d]) for d in degrees]
+        return None if rows[0] is None else np.stack(rows)
+
+    return PolynomialSweep(
+        degrees,
+        None if x_eval is None else np.asarray(x_eval),
+        stack(lambda r: r[1][0]),
+        stack(lambda r: r[0]),
+        stack(lambda r: r[1][1]),
+        y,
+        None if y_test is None else np.asarray(y_test, dtype=np.float64).ravel(),
+    )
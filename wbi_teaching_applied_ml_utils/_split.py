@@ -0,0 +1,69 @@
+import numpy as np
+
+
+class RowView:
+    """
+    The rows `index` of `base`, e.g. a memory-mapped matrix shared by the
+    train and test split, without copying them.
+
+    Rows are only read when the view is indexed (view[i], view[10:20],
+    view[i, :5]), iterated in blocks or converted with np.asarray, which
+    materializes the selected rows.
+    """
+
+    def __init__(self, base, index):
+        self.base = base
+        self.index = np.asarray(index, dtype=np.intp)
+
+    @property
+    def shape(self):
+        return (len(self.index),) + self.base.shape[1:]
+
+    @property
+    def ndim(self):
+        return self.base.ndim
+
+    @property
+    def dtype(self):
+        return self.base.dtype
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return self.base[(self.index[key[0]],) + key[1:]]
+        return self.base[self.index[key]]
+
+    def __iter__(self):
+        for block in self.iter_blocks():
+            yield from block
+
+    def __array__(self, dtype=None, copy=None):
+        rows = self.base[self.index]
+        return rows if dtype is None else rows.astype(dtype, copy=False)
+
+    def iter_blocks(self, block_size=4096):
+        """
+        Yield the rows of the view as arrays of at most `block_size` rows.
+        """
+        for start in range(0, len(self.index), block_size):
+            yield self.base[self.index[start:start + block_size]]
+
+    def __repr__(self):
+        return f'RowView({len(self.index)} of {len(self.base)} rows, dtype={self.dtype})'
+
+
+def split_indices(n, train_size, labels=None, stratify=False, random_state=None):
+    """
+    Split the positions 0..n-1 into (train, test) index arrays, shuffled
+    with `random_state`. With `stratify`, both parts keep the proportions
+    of `labels`. Only the indices are permuted, so for the same n, size and
+    seed the split is the one train_test_split gives for the data itself.
+    """
+    from sklearn.model_selection import train_test_split
+
+    if stratify and labels is None:
+        raise ValueError('stratify=True requires labels')
+    return train_test_split(np.arange(n), train_size=train_size, random_state=random_state,
+                            stratify=np.asarray(labels) if stratify else None)
@@ -0,0 +1,197 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ._lazy import lazy_import
+
+pd = lazy_import('pandas')
+
+# per-process state of the sweep workers
+_data = None
+_features = {}
+
+
+def _init_worker(X_train, y_train, X_test, y_test, random_state, max_iter):
+    global _data
+    _data = (X_train, y_train, X_test, y_test, random_state, max_iter)
+    _features.clear()
+
+
+def _pipelines(alpha, degree):
+    from .exercise2 import Exercise2Utils
+
+    _, _, _, _, random_state, max_iter = _data
+    return Exercise2Utils.get_pipelines(alpha, random_state, max_iter, degree)
+
+
+def _scaled_features(degree):
+    # StandardScaler + PolynomialFeatures do not depend on the model or
+    # alpha, so every worker computes them at most once per degree; the
+    # time is only reported for the call that computed them (0.0 on hits)
+    if degree in _features:
+        train, test = _features[degree]
+        return train, test, 0.0
+    X_train, _, X_test, _, _, _ = _data
+    transform = _pipelines(1.0, degree)[0][0][:-1]
+    start = time.perf_counter()
+    train = transform.fit_transform(X_train)
+    test = transform.transform(X_test)
+    _features[degree] = (train, test)
+    return train, test, time.perf_counter() - start
+
+
+def _fit_one(task):
+    model_index, degree, alpha = task
+    _, y_train, _, y_test, _, _ = _data
+    Phi_train, Phi_test, feature_time = _scaled_features(degree)
+
+    pipeline, name = _pipelines(1.0 if alpha is None else alpha, degree)[model_index]
+    estimator = pipeline[-1]
+
+    start = time.perf_counter()
+    estimator.fit(Phi_train, y_train)
+    fit_time = time.perf_counter() - start
+
+    train_rmse = np.sqrt(np.mean((estimator.predict(Phi_train) - y_train) ** 2))
+    test_rmse = np.sqrt(np.mean((estimator.predict(Phi_test) - y_test) ** 2))
+    return {
+        'model': name,
+        'degree': degree,
+        'alpha': np.nan if alpha is None else alpha,
+        'train_rmse': train_rmse,
+        'test_rmse': test_rmse,
+        'fit_time': fit_time,
+        'feature_time': feature_time,
+        'pid': os.getpid(),
+    }
+
+
+def run_model_sweep(X_train, y_train, X_test, y_test, degrees, alphas, random_state=0,
+                    max_iter=1000, n_jobs=None):
+    """
+    Fit the Linear, Lasso and Ridge pipelines of `get_pipelines` for every
+    degree in `degrees` and (for Lasso and Ridge) every alpha in `alphas`.
+
+    The fits run in a pool of `n_jobs` processes (all cores by default,
+    n_jobs=1 runs in-process). The data is sent to every worker once and
+    the scaled polynomial features are cached per worker and degree, so
+    they are not recomputed for every model and alpha.
+
+    Returns a DataFrame with one row per fit and the columns model, degree,
+    alpha (NaN for linear regression), train_rmse, test_rmse, fit_time (of
+    the estimator alone), feature_time and pid. feature_time is the time of
+    computing the features in that worker and 0.0 where they were cached,
+    so the column sums to the total feature cost.
+    """
+    data = (np.asarray(X_train), np.asarray(y_train).ravel(),
+            np.asarray(X_test), np.asarray(y_test).ravel(), random_state, max_iter)
+
+    # linear regression does not depend on alpha and is fitted once per degree
+    tasks = [(model_index, int(degree), alpha)
+             for degree in degrees
+             for model_index, model_alphas in ((0, [None]), (1, alphas), (2, alphas))
+             for alpha in model_alphas]
+
+    n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+    if n_jobs == 1:
+        _init_worker(*data)
+        rows = [_fit_one(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=data) as pool:
+            # consecutive tasks share a degree, so chunks hit the feature cache
+            chunksize = max(1, len(tasks) // (4 * n_jobs))
+            rows = list(pool.map(_fit_one, tasks, chunksize=chunksize))
+
+    results = pd.DataFrame(rows)
+    return results.sort_values(['model', 'degree', 'alpha'], ignore_index=True)
+
+
+class RegularizationPath:
+    """
+    Coefficients and errors of a model fitted along a decreasing sequence of
+    alphas, as returned by `regularization_path`.
+    """
+
+    def __init__(self, model, degree, alphas, coefs, intercepts, mse_train, mse_test, fit_time):
+        self.model = model
+        self.degree = degree
+        self.alphas = alphas
+        self.coefs = coefs
+        self.intercepts = intercepts
+        self.mse_train = mse_train
+        self.mse_test = mse_test
+        self.fit_time = fit_time
+
+    @property
+    def rmse_train(self):
+        return np.sqrt(self.mse_train)
+
+    @property
+    def rmse_test(self):
+        return np.sqrt(self.mse_test)
+
+
+def _ridge_path(Phi, y, alphas):
+    # Ridge centers X and y to fit the intercept; with the SVD of the
+    # centered design matrix every alpha is a cheap diagonal rescaling
+    x_mean, y_mean = Phi.mean(axis=0), y.mean()
+    U, s, Vt = np.linalg.svd(Phi - x_mean, full_matrices=False)
+    Uty = U.T @ (y - y_mean)
+    # singular values at rounding level, e.g. of the constant bias column,
+    # are dropped as in a pseudo-inverse, so alpha=0 gives least squares
+    # instead of 0/0
+    tol = max(Phi.shape) * np.finfo(s.dtype).eps * s.max(initial=0)
+    shrink = np.divide(s[None, :], s[None, :] ** 2 + alphas[:, None],
+                       out=np.zeros((len(alphas), len(s))), where=s[None, :] > tol)
+    coefs = (shrink * Uty[None, :]) @ Vt
+    return coefs, y_mean - coefs @ x_mean
+
+
+def _lasso_path(Phi, y, alphas, estimator):
+    # coordinate descent along the decreasing alphas, each fit starting
+    # from the coefficients of the previous one, with the estimator's
+    # stopping criteria; the intercept is recovered from the centering
+    from sklearn.linear_model import lasso_path
+
+    x_mean, y_mean = Phi.mean(axis=0), y.mean()
+    _, coefs, _ = lasso_path(Phi - x_mean, y - y_mean, alphas=alphas,
+                             max_iter=estimator.max_iter, tol=estimator.tol)
+    coefs = coefs.T
+    return coefs, y_mean - coefs @ x_mean
+
+
+def regularization_path(X_train, y_train, X_test, y_test, degree, alphas, model='lasso',
+                        random_state=0, max_iter=1000):
+    """
+    Fit the Lasso or Ridge pipeline of `get_pipelines` for all `alphas`,
+    from the largest to the smallest.
+
+    The scaled polynomial features are computed once. Lasso is warm-started
+    from the coefficients of the previous alpha, Ridge reuses a single SVD
+    of the design matrix for the whole path. The returned RegularizationPath
+    can be passed to plot_validation_curve.
+    """
+    from .exercise2 import Exercise2Utils
+
+    model_index = {'lasso': 1, 'ridge': 2}[model.lower()]
+    alphas = np.sort(np.asarray(alphas, dtype=np.float64))[::-1]
+    y_train = np.asarray(y_train, dtype=np.float64).ravel()
+    y_test = np.asarray(y_test, dtype=np.float64).ravel()
+
+    pipeline, name = Exercise2Utils.get_pipelines(alphas[0], random_state, max_iter, degree)[model_index]
+    transform, estimator = pipeline[:-1], pipeline[-1]
+    Phi_train = transform.fit_transform(np.asarray(X_train))
+    Phi_test = transform.transform(np.asarray(X_test))
+
+    start = time.perf_counter()
+    if model_index == 2:
+        coefs, intercepts = _ridge_path(Phi_train, y_train, alphas)
+    else:
+        coefs, intercepts = _lasso_path(Phi_train, y_train, alphas, estimator)
+    fit_time = time.perf_counter() - start
+
+    mse_train = np.mean((Phi_train @ coefs.T + intercepts - y_train[:, None]) ** 2, axis=0)
+    mse_test = np.mean((Phi_test @ coefs.T + intercepts - y_test[:, None]) ** 2, axis=0)
+    return RegularizationPath(name, degree, alphas, coefs, intercepts, mse_train, mse_test, fit_time)
@@ -0,0 +1,161 @@
+import os
+import shutil
+import tempfile
+from collections import Counter
+
+import numpy as np
+
+from ._datasets import cache_dir, kwargs_tag, read_json, source_hash, write_json
+from ._instrument import add_bytes_read
+from ._lazy import lazy_import
+
+sparse = lazy_import('scipy.sparse')
+
+# bump whenever the layout of the cache directory changes
+CACHE_VERSION = 1
+
+
+def iter_tsv(path, chunksize=10000, comments='#', encoding='utf-8'):
+    """
+    Stream a tab-separated (sentence, label) file and yield lists of
+    stripped sentences and labels with up to `chunksize` entries.
+
+    Like np.loadtxt, everything after `comments` is ignored and empty lines
+    are skipped. The label is taken from the last tab on every line.
+    """
+    sentences, labels = [], []
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            if comments:
+                line = line.split(comments, 1)[0]
+            if not line.strip():
+                continue
+            sentence, _, label = line.rstrip('\r\n').rpartition('\t')
+            sentences.append(sentence.strip())
+            labels.append(label.strip())
+            if len(sentences) == chunksize:
+                yield sentences, labels
+                sentences, labels = [], []
+    if sentences:
+        yield sentences, labels
+
+
+def read_tsv(path, **kwargs):
+    """
+    Read a tab-separated (sentence, label) file into two string arrays.
+    """
+    sentences, labels = [], []
+    for chunk_sentences, chunk_labels in iter_tsv(path, **kwargs):
+        sentences.extend(chunk_sentences)
+        labels.extend(chunk_labels)
+    return np.array(sentences, dtype=str), np.array(labels, dtype=str)
+
+
+def _vocabulary(path, analyzer, min_df, max_df, max_features, chunksize):
+    # first pass: document and term frequencies, one chunk at a time
+    df, tf = Counter(), Counter()
+    n_docs = 0
+    for sentences, _ in iter_tsv(path, chunksize=chunksize):
+        for sentence in sentences:
+            tokens = analyzer(sentence)
+            tf.update(tokens)
+            df.update(set(tokens))
+        n_docs += len(sentences)
+
+    # same limits as sklearn's CountVectorizer
+    min_count = min_df if isinstance(min_df, int) else min_df * n_docs
+    max_count = max_df if isinstance(max_df, int) else max_df * n_docs
+    terms = sorted(term for term, count in df.items() if min_count <= count <= max_count)
+    if max_features is not None and len(terms) > max_features:
+        # the same selection (and tie-breaking) as sklearn
+        counts = np.array([tf[term] for term in terms])
+        keep = np.sort((-counts).argsort()[:max_features])
+        terms = [terms[i] for i in keep]
+    doc_freq = np.array([df[term] for term in terms], dtype=np.float64)
+    return terms, doc_freq, n_docs
+
+
+def vectorize_tsv(path, kind='tfidf', min_df=1, max_df=1.0, max_features=None, chunksize=10000,
+                  **vectorizer_kwargs):
+    """
+    Bag-of-words ('count') or TF-IDF ('tfidf') matrix of the sentences in a
+    tab-separated file, built in two streaming passes.
+
+    The first pass collects the vocabulary, the second transforms one chunk
+    of sentences at a time with a fixed-vocabulary CountVectorizer, so only
+    the sparse result is ever held in memory. TF-IDF weights follow the
+    defaults of sklearn's TfidfVectorizer (smooth idf, l2 norm).
+
+    Returns the CSR matrix and the feature names.
+    """
+    from sklearn.feature_extraction.text import CountVectorizer
+    from sklearn.preprocessing import normalize
+
+    if kind not in ('count', 'tfidf'):
+        raise ValueError(f"kind must be 'count' or 'tfidf', got {kind!r}")
+
+    analyzer = CountVectorizer(**vectorizer_kwargs).build_analyzer()
+    terms, doc_freq, n_docs = _vocabulary(path, analyzer, min_df, max_df, max_features, chunksize)
+    vectorizer = CountVectorizer(vocabulary={term: i for i, term in enumerate(terms)}, **vectorizer_kwargs)
+
+    blocks = [vectorizer.transform(sentences) for sentences, _ in iter_tsv(path, chunksize=chunksize)]
+    X = sparse.vstack(blocks, format='csr') if blocks else sparse.csr_matrix((0, len(terms)))
+    X = X.astype(np.float64)
+
+    if kind == 'tfidf':
+        idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1
+        X = normalize(X @ sparse.diags(idf), norm='l2', copy=False).tocsr()
+    return X, np.array(terms, dtype=str)
+
+
+def load_vectorized_tsv(path, use_cache=True, **kwargs):
+    """
+    `vectorize_tsv(path, **kwargs)` persisted on disk, keyed by the sha256
+    of the file and the vectorizer settings, so that it is built only once.
+    If the cache directory is not writable the file is vectorized directly.
+    """
+    root = os.path.join(cache_dir(), 'text')
+    if use_cache:
+        try:
+            os.makedirs(root, exist_ok=True)
+            sha = source_hash(path, root)
+        except OSError:
+            use_cache = False
+    if not use_cache:
+        # two streaming passes over the file
+        add_bytes_read(2 * os.path.getsize(path))
+        return vectorize_tsv(path, **kwargs)
+
+    settings = sorted((k, repr(v)) for k, v in kwargs.items())
+    key = sha[:16] + '-' + kwargs_tag(kwargs)
+    target = os.path.join(root, f'{os.path.basename(path)}-{key}')
+
+    index = read_json(os.path.join(target, 'index.json'))
+    if index is not None and index.get('version') == CACHE_VERSION:
+        try:
+            add_bytes_read(sum(entry.stat().st_size for entry in os.scandir(target)))
+            return (sparse.load_npz(os.path.join(target, 'matrix.npz')).tocsr(),
+                    np.load(os.path.join(target, 'features.npy'), allow_pickle=False))
+        except (OSError, ValueError):
+            pass
+
+    add_bytes_read(2 * os.path.getsize(path))
+    X, features = vectorize_tsv(path, **kwargs)
+    try:
+        tmp = tempfile.mkdtemp(dir=root, prefix='.building-')
+    except OSError:
+        return X, features
+    try:
+        sparse.save_npz(os.path.join(tmp, 'matrix.npz'), X)
+        np.save(os.path.join(tmp, 'features.npy'), features, allow_pickle=False)
+        write_json(os.path.join(tmp, 'index.json'), {'version': CACHE_VERSION, 'settings': settings})
+        shutil.rmtree(target, ignore_errors=True)
+        try:
+            os.rename(tmp, target)
+        except OSError:
+            # another process finished building the same cache first
+            if not os.path.isdir(target):
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return X, features
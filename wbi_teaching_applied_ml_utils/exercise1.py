@@ -0,0 +1,138 @@
+import os
+
+import numpy as np
+
+from ._batch import plt
+from ._datasets import dataset_path, iter_row_blocks, load_dataset, require_datasets
+from ._embeddings import load_embedding_rows
+from ._images import fetch_images
+from ._instrument import instrument_class
+from ._knn import KNNIndex
+from ._split import RowView, split_indices
+
+
+@instrument_class
+class Exercise1Utils:
+    ## Define a function that displays a dog
+    images_URL = os.environ.get(
+        'WBI_AML_IMAGES_URL', "http://vision.stanford.edu/aditya86/ImageNetDogs/images/")
+    images_offline = os.environ.get('WBI_AML_OFFLINE', '') not in ('', '0')
+
+    # build with KNNIndex(x_train, filenames_train, y_train)
+    KNNIndex = KNNIndex
+
+
+    def load_npy(file_name, mmap_mode=None):
+        return load_dataset(np.load, 'exercise1', file_name, mmap_mode=mmap_mode)
+
+    @staticmethod
+    def load_data_exercise_1(mmap_mode=None):
+        # With mmap_mode='r' the arrays are memory-mapped and only read from
+        # disk when accessed, e.g. block by block with iter_row_blocks
+        file_names = ['train_data.npy', 'train_labels.npy', 'test_data.npy', 'test_labels.npy']
+        require_datasets('exercise1', *file_names)
+        train_data, train_labels, test_data, test_labels = (
+            Exercise1Utils.load_npy(file_name, mmap_mode=mmap_mode) for file_name in file_names)
+            
+        return train_data, train_labels, test_data, test_labels
+
+    iter_row_blocks = staticmethod(iter_row_blocks)
+
+    @staticmethod
+    def load_data_exercise_1_dog_embeddings(subset, use_cache=True, train_size=1000, stratify=False,
+                                            random_state=47, lazy=False):
+        file_name = 'vectors.csv.gz'
+        embeddings_path = dataset_path('exercise1', file_name)
+
+        # The decoded embeddings are cached as memory-mapped .npy files,
+        # keyed by the hash of the csv, and only rebuilt when it changes.
+        # Without the cache, the csv is streamed and only the rows of the
+        # selected classes are decoded. `rows` are the positions of the
+        # subset in the shared arrays; nothing has been copied yet.
+        x, y, filenames, rows = load_embedding_rows(embeddings_path, subset=subset, use_cache=use_cache)
+
+        # only the indices are shuffled; idx_train/idx_test are positions
+        # within the subset, as before
+        labels = y[rows]
+        idx_train, idx_test = split_indices(len(rows), train_size, labels=labels, stratify=stratify,
+                                            random_state=random_state)
+
+        if lazy:
+            # x and filenames stay views over the shared (memory-mapped)
+            # arrays and are only read when indexed or converted
+            x_train, x_test = RowView(x, rows[idx_train]), RowView(x, rows[idx_test])
+            filenames_train, filenames_test = RowView(filenames, rows[idx_train]), RowView(filenames, rows[idx_test])
+        else:
+            x_train, x_test = x[rows[idx_train]], x[rows[idx_test]]
+            filenames_train, filenames_test = filenames[rows[idx_train]], filenames[rows[idx_test]]
+        y_train, y_test = labels[idx_train], labels[idx_test]
+
+        return (x_train, x_test, 
+                y_train, y_test, 
+                idx_train, idx_test, 
+                filenames_train, filenames_test)
+
+    # lazy split of the embeddings (load_data_exercise_1_dog_embeddings(..., lazy=True))
+    RowView = RowView
+    split_indices = staticmethod(split_indices)
+
+    @staticmethod
+    def fetch_images(filenames):
+        # Images are downloaded in parallel over a pooled session and kept in
+        # an LRU disk cache; with images_offline only the cache is used
+        urls = [f'{Exercise1Utils.images_URL}/{filename}.jpg' for filename in filenames]
+        return fetch_images(urls, offline=Exercise1Utils.images_offline)
+
+    @staticmethod
+    def plot_dog(filename, label):
+
+        plt.axis('off')
+        img, = Exercise1Utils.fetch_images([filename])
+        if img is not None:
+            plt.imshow(img)
+        plt.show()
+        print("Label ", label)
+
+    @staticmethod
+    def plot_knn_results(query_file_name, query_label, filenames_train=None, labels=None, train=True,
+                         index=None, query=None, k=5):
+        # Either the neighbours are given by filenames_train and labels, or
+        # they are looked up for the embedding `query` in a KNNIndex
+        if index is not None:
+            _, indices, filenames, neighbour_labels = index.query(query, k)
+            # missing neighbours of an approximate search are left out
+            found = indices[0] >= 0
+            filenames_train = filenames[0][found]
+            labels = neighbour_labels[0][found] if neighbour_labels is not None else [''] * len(filenames_train)
+
+        # Plot search results        
+        k = len(filenames_train)
+        fig, ax = plt.subplots(1, k+1, figsize=(3*(k+1),4))
+
+        images = Exercise1Utils.fetch_images([query_file_name, *filenames_train])
+
+        img = images[0]
+        if img is not None:
+            ax[0].imshow(img)
+            ax[0].axis('off')
+            ax[0].set_title(f"Query: {query_label}")
+
+        for i, img in enumerate(images[1:]):
+            if img is not None:
+                ax[1+i].imshow(img)
+                ax[1+i].axis('off')
+                ax[1+i].set_title(f"{i+1}-NN: {labels[i]}")
+
+                #xy = (d_train["xmin"], d_train["ymin"])
+                #width = d_train["xmax"]-d_train["xmin"]
+                #height = d_train["ymax"]-d_train["ymin"]
+                #rect = Rectangle(xy, width, height, edgecolor='white', fill=None)
+                #ax[1+i].add_patch(rect)
+                #ax[1+i].text(xy[0], xy[1], d_train["class"], fontsize=12, color='white', 
+                #             verticalalignment='bottom', horizontalalignment='left')
+                
+            else:
+                ax[i+1].remove()
+
+        plt.tight_layout()
+        plt.show()
@@ -0,0 +1,214 @@
+import numpy as np
+
+from ._batch import plt
+from ._datasets import load_dataset
+from ._instrument import instrument_class
+from ._loss import loss_surface, mse
+from ._poly import PolynomialSweep, polynomial_sweep
+from ._sweep import RegularizationPath, regularization_path, run_model_sweep
+
+
+@instrument_class
+class Exercise2Utils:
+    @staticmethod
+    def load_data_exercise_2(mmap_mode=None):
+        data = load_dataset(np.loadtxt, 'exercise2', 'ex1data2.txt', delimiter=',', dtype=np.float64,
+                            mmap_mode=mmap_mode)
+        x = data[:, :1] / 100 # We will only use the size as a feature
+        y = data[:, 2] / 1000 # convert to 1000$
+        m = y.size
+        return x, y, m
+
+    @staticmethod
+    def plotData(x_train, y_train, x_test, y_test):
+        plt.figure(figsize=(10,5))
+        plt.scatter(x_train, y_train, label='train data')
+        plt.scatter(x_test, y_test, label='test data')
+        plt.ylabel('Price in 1000$')
+        plt.xlabel('Size in 100 sq-feet')
+        plt.legend(loc=4)
+
+    @staticmethod
+    def plotLine(x_train, y_train, x_test, y_test, w):
+        Exercise2Utils.plotData(x_train, y_train, x_test, y_test)
+
+        # Regression Line
+        axes = plt.gca()
+        x_vals = np.array(axes.get_xlim())
+        y_vals = w[0] + w[1] * x_vals
+        plt.plot(x_vals, y_vals, '-')
+
+    # @staticmethod
+    # def plotPolyLine(x_train, y_train, x_test, y_test, w):
+    #     Exercise2Utils.plotData(x_train, y_train, x_test, y_test)
+
+    #     # Regression Line
+    #     axes = plt.gca()
+    #     x_vals = np.array(axes.get_xlim())
+    #     y_vals = w[0] + w[1] * x_vals
+    #     plt.plot(x_vals, y_vals, '-')
+
+    #     # Regression Polynom
+    #     X_poly = mapPolynomialFeatures(x[:, 0], np.ones(len(x[:, 0])), 3)
+    #     w_poly = normalEqn(X_poly, y);
+    #     x1 = np.float32(np.linspace(500, 4500, 1000))
+    #     x2 = np.float32(np.linspace(1, 1, 1000))
+    #     polys = mapPolynomialFeatures(x1, x2, 3)
+
+    #     y_vals = predictPrice(polys, w_poly)
+    #     plt.plot(x1, y_vals, '.')
+
+    @staticmethod
+    def plotPolyLines(
+            x_train, y_train, x_test, y_test, w, degree, 
+            mapPolynomialFeatures=None, normalEqn=None, predictPrice=None
+        ):
+        Exercise2Utils.plotData(x_train, y_train, x_test, y_test)
+            
+        # Regression Polynom
+        x1 = np.float32(np.linspace(5, 45, 100))
+        if mapPolynomialFeatures is None or normalEqn is None or predictPrice is None:
+            # fit all degrees in one pass, extending the fit degree by degree
+            sweep = polynomial_sweep(x_train[:,0], y_train, np.arange(2, degree+1), x_eval=x1)
+            for degree, y_vals in zip(sweep.degrees, sweep.predictions):
+                latex = "$\\dots+size^"+str(degree)+"$"
+                plt.plot(x1, y_vals, alpha=0.8, lw=2, label=latex)
+            plt.legend()
+            return
+
+        for degree in np.arange(2, degree+1) :
+            X_poly = mapPolynomialFeatures(x_train[:,0], degree)    
+            w_poly = normalEqn(X_poly, y_train);
+            polys = mapPolynomialFeatures(x1, degree)
+            y_vals = predictPrice(polys, w_poly)  
+            latex = "$\\dots+size^"+str(degree)+"$"
+            plt.plot(x1, y_vals, alpha=0.8, lw=2, label=latex)
+        
+        plt.legend()
+        
+
+    polynomial_sweep = staticmethod(polynomial_sweep)
+
+    loss_surface = staticmethod(loss_surface)
+
+    @staticmethod
+    def plotLossFunction(X, y, w0_vals, w1_vals, L_vals=None, w=None, loss=None):
+        """
+        Surface and contour plot of the loss over the (w0, w1) grid. Without
+        L_vals, it is computed with the batched loss(x, y, w0, w1) (the MSE
+        by default), which takes 1d arrays of w0 and w1 values in the order
+        of this signature and returns one loss per pair.
+        """
+        if L_vals is None:
+            # X is either the feature or the design matrix [1, x]
+            X = np.asarray(X)
+            x = X[:, -1] if X.ndim == 2 else X
+            if np.ndim(w0_vals) == 1 and np.ndim(w1_vals) == 1:
+                w0_vals, w1_vals = np.meshgrid(w0_vals, w1_vals)
+            L_vals = loss_surface(x, y, w0_vals, w1_vals, loss=mse if loss is None else loss)
+        if w is None:
+            # mark the minimum of the grid instead
+            best = np.unravel_index(np.argmin(L_vals), np.shape(L_vals))
+            w = (np.asarray(w0_vals)[best], np.asarray(w1_vals)[best])
+
+        # surface plot
+        fig = plt.figure(figsize=(12, 5))
+        ax = fig.add_subplot(121, projection='3d')
+        ax.plot_surface(w0_vals, w1_vals, L_vals, cmap='viridis')
+        plt.xlabel('w0')
+        plt.ylabel('w1')
+        plt.title('Surface')
+
+        # contour plot
+        ax = plt.subplot(122)
+        plt.contour(w0_vals, w1_vals, L_vals, linewidths=2, levels=20)
+        plt.xlabel('w0')
+        plt.ylabel('w1')
+        plt.plot(w[0], w[1], 'ro', ms=10, lw=2)
+        plt.title('Contour, showing minimum')
+
+    @staticmethod
+    def plot_one(X_train, y_train, X_test, y_test, degree_predictions, x_interval=None, degree=None):
+        if isinstance(degree_predictions, PolynomialSweep):
+            sweep = degree_predictions
+            degree_predictions = sweep.predictions
+            x_interval = sweep.x_eval if x_interval is None else x_interval
+            degree = sweep.degrees if degree is None else degree
+        plt.figure(figsize=(10,5))
+        plt.plot(X_train, y_train, 'o', label='training data', markersize=10)
+        plt.plot(X_test, y_test, 'o', label='test data', markersize=10)
+        for i,degree in enumerate(degree):
+            plt.plot(x_interval, degree_predictions[i],
+                     alpha=0.8, lw=2, label='degree={}'.format(degree))
+        plt.legend(loc=4)
+        plt.ylim(0,1000)
+        plt.xlim(0,60)
+
+    @staticmethod
+    def plot_validation_curve(mse_train, mse_test=None, degrees=None):
+        path = None
+        if isinstance(mse_train, PolynomialSweep):
+            sweep = mse_train
+            mse_train, mse_test, degrees = sweep.mse_train, sweep.mse_test, sweep.degrees
+        elif isinstance(mse_train, RegularizationPath):
+            path = mse_train
+            mse_train, mse_test, degrees = path.mse_train, path.mse_test, path.alphas
+        plt.figure(figsize=(14,5))
+        plt.title('Validation Curve')
+        plt.ylabel('RMSE')
+        # plt.ylim(0, 100)
+        if path is None:
+            plt.xlabel('poly')
+            plt.xticks(np.arange(min(degrees), max(degrees)+1, 1.0))
+        else:
+            plt.title(f'Validation Curve ({path.model}, degree {path.degree})')
+            plt.xlabel('alpha')
+            plt.xscale('log')
+
+        plt.plot(degrees, np.sqrt(mse_train), label='Training MSE', color='darkorange', lw=2)
+        plt.plot(degrees, np.sqrt(mse_test), label='Test MSE', color='navy', lw=2)
+        plt.legend(loc='best')
+        plt.show()
+
+    @staticmethod
+    def plot_polynomial_rmse(polys, Ls_poly_train=None, Ls_poly_test=None, logscale=False):
+        if isinstance(polys, PolynomialSweep):
+            sweep = polys
+            polys, Ls_poly_train, Ls_poly_test = sweep.degrees, sweep.rmse_train, sweep.rmse_test
+
+        plt.figure(figsize=(10,5))  
+        plt.plot(polys, Ls_poly_train, '-', label="RMSE train")
+        
+        if Ls_poly_test is not None:
+            plt.plot(polys, Ls_poly_test, '-', label="RMSE test")
+        
+        if logscale:
+            plt.yscale('log')  # Set y-axis to log scale
+        
+        plt.xlabel('polynomial degree')
+        plt.ylabel('RMSE')
+        plt.title('RMSE for varying polynomial degrees')
+        _ = plt.legend(loc='best')
+
+    @staticmethod
+    def get_pipelines(alpha, random_state, max_iter, degree):
+        from sklearn.pipeline import make_pipeline
+        from sklearn.preprocessing import StandardScaler, PolynomialFeatures
+        from sklearn.linear_model import Lasso, Ridge, LinearRegression
+
+        result = (make_pipeline(
+                StandardScaler(), 
+                PolynomialFeatures(degree=degree), 
+                LinearRegression()), "Linear Regression")
+        result2 = (make_pipeline(
+                StandardScaler(), 
+                PolynomialFeatures(degree=degree), 
+                Lasso(alpha=alpha, max_iter = max_iter, random_state=random_state)), "Lasso Regression")
+        result3 = (make_pipeline(
+                StandardScaler(), 
+                PolynomialFeatures(degree=degree), 
+                Ridge(alpha=alpha, max_iter = max_iter, random_state=random_state)), "Ridge Regression")
+        return (result, result2, result3)
+
+    run_model_sweep = staticmethod(run_model_sweep)
+    regularization_path = staticmethod(regularization_path)
@@ -0,0 +1,163 @@
+import numpy as np
+
+from ._batch import plt
+from ._datasets import dataset_path, load_dataset
+from ._features import iter_map_feature, map_feature
+from ._instrument import instrument_class
+from ._text import load_vectorized_tsv, read_tsv
+
+
+@instrument_class
+class Exercise3Utils:
+    @staticmethod
+    def load_exam_data(mmap_mode=None):
+        # The first two columns contains the exam scores and the third column
+        # contains the label.
+        data = load_dataset(np.loadtxt, 'exercise3', 'ex2data1.txt', delimiter=',', dtype=np.float64,
+                            mmap_mode=mmap_mode)
+        X, y = data[:, 0:2], data[:, 2]
+        
+        # we norm the data
+        from sklearn.preprocessing import StandardScaler
+        scaler = StandardScaler()
+        X = scaler.fit_transform(X)
+        
+        return X, y, scaler
+
+    @staticmethod
+    def load_microchip_data(mmap_mode=None):
+        data = load_dataset(np.loadtxt, 'exercise3', 'ex2data2.txt', delimiter=',', dtype=np.float64,
+                            mmap_mode=mmap_mode)
+        X = data[:, :2]
+        y = data[:, 2]
+        
+        # we norm the data
+        from sklearn.preprocessing import StandardScaler
+        scaler = StandardScaler()
+        X = scaler.fit_transform(X)
+        
+        return X, y, scaler
+
+
+    @staticmethod
+    def load_sentiment_data():
+        ## Stream the tab separated file into sentences and labels
+        sentences, labels = load_dataset(read_tsv, 'exercise3', 'full_set.txt')
+
+        ## Transform the labels from '0 v.s. 1' to '-1 v.s. 1'
+        y = np.array(labels, dtype='int8')
+        y = 2*y - 1
+        
+        return sentences, labels, y
+
+    @staticmethod
+    def vectorize_sentiment_data(kind='tfidf', use_cache=True, **kwargs):
+        """
+        Bag-of-words ('count') or TF-IDF ('tfidf') CSR matrix of the
+        sentences of load_sentiment_data, in the same order, and its feature
+        names. The result is built in bounded memory and cached on disk,
+        keyed by the hash of the data file and the settings. Further
+        keyword arguments go to sklearn's CountVectorizer.
+        """
+        return load_vectorized_tsv(dataset_path('exercise3', 'full_set.txt'), use_cache=use_cache,
+                                   kind=kind, **kwargs)
+
+
+    @staticmethod
+    def plotData(X, y):
+        fig = plt.figure(figsize=(12,8))
+
+        # Find Indices of Positive and Negative Examples
+        pos = y == 1
+        neg = y == 0
+
+        # Plot Examples
+        plt.plot(X[pos, 0], X[pos, 1], 'x', lw=2, ms=10)
+        plt.plot(X[neg, 0], X[neg, 1], 'o', ms=10)
+
+        plt.xlabel('Normalized Exam 1 score')
+        plt.ylabel('Normalized Exam 2 score')
+
+        plt.legend(['Admitted', 'Not admitted'])
+
+    @staticmethod
+    def mapFeature(X1, X2, degree=6, out=None, dtype=np.float64):
+        return map_feature(X1, X2, degree, out=out, dtype=dtype)
+
+    mapFeatureBlocks = staticmethod(iter_map_feature)
+
+    @staticmethod
+    def plotDecisionBoundary(plotData, theta, X, y, degree=6, grid_size=50, grid_range=(-2, 2)):
+        # make sure theta is a numpy array
+        theta = np.array(theta)
+
+        # Plot Data (remember first column in X is the intercept)
+        plotData(X[:, 1:3], y)
+
+        if X.shape[1] <= 3:
+            # Only need 2 points to define a line, so choose two endpoints
+            plot_x = np.array([np.min(X[:, 1]), np.max(X[:, 1])])
+
+            # Calculate the decision boundary line
+            plot_y = (-1. / theta[2]) * (theta[1] * plot_x + theta[0])
+
+            # Plot, and adjust axes for better viewing
+            plt.plot(plot_x, plot_y)
+
+            # Legend, specific for the exercise
+            plt.legend(['Admitted', 'Not admitted', 'Decision Boundary'])
+            #plt.xlim([1, 100])
+            #plt.ylim([1, 100])
+        else:
+            # Here is the grid range, either (lo, hi) for both axes or
+            # ((u_lo, u_hi), (v_lo, v_hi))
+            u_range, v_range = np.broadcast_to(np.asarray(grid_range, dtype=np.float64), (2, 2))
+            u = np.linspace(*u_range, grid_size)
+            v = np.linspace(*v_range, grid_size)
+
+            # Evaluate z = theta*x over the whole grid at once; z[j, i]
+            # belongs to (u[i], v[j]) as expected by contour
+            z = Exercise3Utils.evaluateGrid(u, v, theta, degree)
+
+            plt.contour(u, v, z, levels=[0], linewidths=2, colors='g')
+
+        plt.tight_layout()
+
+    @staticmethod
+    def evaluateGrid(u, v, theta, degree=6, chunk_size=65536):
+        """
+        Evaluate mapFeature(u_i, v_j) @ theta on the grid spanned by u and v
+        in blocks of `chunk_size` points. Returns an array of shape
+        (len(v), len(u)).
+        """
+        uu, vv = np.meshgrid(u, v)
+        z = np.empty(uu.size, dtype=np.float64)
+        for rows, block in iter_map_feature(uu.ravel(), vv.ravel(), degree, block_size=chunk_size):
+            z[rows] = block @ theta
+        return z.reshape(len(v), len(u))
+
+    @staticmethod
+    def vis_coef(estimator, feature_names, topn = 10):
+        """
+        Visualize the top-n most influential coefficients
+        for linear models.
+        """
+        fig = plt.figure(figsize=(10,15))
+        if hasattr(feature_names, 'get_feature_names_out'):
+            # a fitted vectorizer
+            feature_names = feature_names.get_feature_names_out()
+        feature_names = np.asarray(feature_names)
+
+        coefs  = estimator.coef_[0]
+        sorted_coefs = np.argsort(coefs)
+        positive_coefs = sorted_coefs[-topn:]
+        negative_coefs = sorted_coefs[:topn]
+
+        top_coefs = np.hstack([negative_coefs, positive_coefs])
+        colors = ['r' if c < 0 else 'b' for c in coefs[top_coefs]]
+        y_pos = np.arange(2 * topn)
+        plt.barh(y_pos, coefs[top_coefs], color = colors, align = 'center')
+        plt.yticks(y_pos, feature_names[top_coefs])
+        plt.title('top {} positive/negative words'.format(topn))
+
+        plt.tight_layout()
@@ -0,0 +1,145 @@
+import numpy as np
+
+from ._batch import plt
+from ._boundary import predict_grid, render_adaptive
+from ._datasets import load_dataset
+from ._instrument import instrument_class
+
+
+@instrument_class
+class Exercise4Utils:
+
+    @staticmethod
+    def load_data(name, mmap_mode=None):
+        # Load data
+        return load_dataset(np.loadtxt, 'exercise4', name, dtype=np.float64, mmap_mode=mmap_mode)
+
+
+    @staticmethod
+    def plotData(X, y, grid=False):
+        # Find Indices of Positive and Negative Examples
+        pos = y == 1
+        neg = y == 0
+
+        # Plot Examples
+        plt.plot(X[pos, 0], X[pos, 1], 'X', mew=1, ms=10, mec='k')
+        plt.plot(X[neg, 0], X[neg, 1], 'o', mew=1, mfc='y', ms=10, mec='k')
+        plt.grid(grid)
+
+
+    @staticmethod
+    def plotMargin(x, y, w, converged, predict, vectorized=None) :
+        # Determine the x1- and x2- limits of the plot
+        x1min = min(x[:,0]) - 0.5
+        x1max = max(x[:,0]) + 0.5
+        x2min = min(x[:,1]) - 0.5
+        x2max = max(x[:,1]) + 0.5
+        
+        plt.xlim(x1min,x1max)
+        plt.ylim(x2min,x2max)
+        
+        # Plot the data points
+        plt.plot(x[(y==1),0], x[(y==1),1], 'ro')
+        plt.plot(x[(y==-1),0], x[(y==-1),1], 'k^')
+        # Construct a grid of points at which to evaluate the classifier
+        if converged:
+            grid_spacing = 0.02
+            xx1, xx2 = np.meshgrid(np.arange(x1min, x1max, grid_spacing), np.arange(x2min, x2max, grid_spacing))
+            grid = np.c_[xx1.ravel(), xx2.ravel()]
+
+            Grid = np.concatenate([np.ones((grid.shape[0], 1)), grid], axis=1)        
+            # predict is called on whole blocks of the grid if it supports
+            # it, otherwise once per point
+            Z = predict_grid(predict, w, Grid, vectorized=vectorized)
+            
+            # Show the classifier's boundary using a color plot
+            Z = Z.reshape(xx1.shape)
+            plt.pcolormesh(xx1, xx2, Z, shading='auto', 
+                            cmap=plt.cm.PRGn, vmin=-3, vmax=3)
+        
+    @staticmethod 
+    def display_data_and_boundary(x, y, w, predictMultiClass, vectorized=None):
+        
+        #fig = plt.figure(figsize=(6,6))
+        
+        # Determine the x1- and x2- limits of the plot
+        x1min = min(x[:,0]) - 1
+        x1max = max(x[:,0]) + 1
+        x2min = min(x[:,1]) - 1
+        x2max = max(x[:,1]) + 1
+        plt.xlim(x1min,x1max)
+        plt.ylim(x2min,x2max)
+
+        # Plot the data points
+        k = int(max(y)) + 1
+        cols = ['ro', 'k^', 'b*','gx']
+        for label in range(k):
+            plt.plot(x[(y==label),0], x[(y==label),1], cols[label%4], markersize=8)
+        
+        # Construct a grid of points at which to evaluate the classifier
+        grid_spacing = 0.05
+        xx1, xx2 = np.meshgrid(np.arange(x1min, x1max, grid_spacing), np.arange(x2min, x2max, grid_spacing))
+        grid = np.c_[xx1.ravel(), xx2.ravel()]
+        
+        Grid = np.concatenate([np.ones((grid.shape[0], 1)), grid], axis=1)        
+        Z = predict_grid(predictMultiClass, w, Grid, vectorized=vectorized)
+        #Z = np.array([predictMultiClass(w, pt) for pt in grid])
+        
+        # Show the classifier's boundary using a color plot
+        Z = Z.reshape(xx1.shape)
+        plt.pcolormesh(xx1, xx2, Z, shading='auto', 
+            cmap=plt.cm.Pastel1, vmin=0, vmax=k)
+        plt.show()
+
+    @staticmethod
+    def visualizeBoundary(X, y, clf, adaptive=True, return_stats=False):
+        #fig = plt.figure(figsize=(6,6))
+        Exercise4Utils.plotData(X, y)
+
+        h = .01  # step size in the mesh
+
+        # create a mesh to plot in
+        x_min, x_max = X[:, 0].min()-h, X[:, 0].max()+h
+        y_min, y_max = X[:, 1].min()-h, X[:, 1].max()+h
+        xs, ys = np.arange(x_min, x_max, h), np.arange(y_min, y_max, h)
+
+        # clf.predict is only evaluated where the predicted class changes
+        Z, stats = render_adaptive(clf.predict, xs, ys, coarse_step=8 if adaptive else 1)
+
+        # Put the result into a color plot
+        plt.contourf(xs, ys, Z, cmap=plt.cm.coolwarm, alpha=0.8)
+        
+        # Plot also the training points
+        plt.scatter(X[:, 0], X[:, 1], color="g", s=3)
+
+        plt.show()
+        if return_stats:
+            return stats
+
+    @staticmethod
+    def visualizeBoundaryLinear(X, y, clf, adaptive=True, return_stats=False) :
+        #fig = plt.figure(figsize=(6,6))
+        Exercise4Utils.plotData(X, y)
+        
+        # step size in the mesh
+        h = .01
+
+        # create a mesh to plot in
+        x_min, x_max = X[:, 0].min()-h, X[:, 0].max()+h
+        y_min, y_max = X[:, 1].min()-h, X[:, 1].max()+h
+        xs, ys = np.arange(x_min, x_max, h), np.arange(y_min, y_max, h)
+
+        # clf.predict is only evaluated where the predicted class changes
+        Z, stats = render_adaptive(clf.predict, xs, ys, coarse_step=8 if adaptive else 1)
+
+        # Put the result into a color plot
+        plt.contourf(xs, ys, Z, cmap=plt.cm.coolwarm, alpha=0.8)
+        plt.axis('off')
+
+        # Plot also the training points
+        color_map = {-1: (1, 1, 1), 0: (0, 0, 0.9), 1: (1, 0, 0), 2: (0.8, 0.6, 0)}
+        colors = [color_map[y] for y in y]
+        plt.scatter(X[:, 0], X[:, 1], c=colors, edgecolors='black')
+        plt.show()
+        if return_stats:
+            return stats
@@ -0,0 +1,184 @@
+import numpy as np
+
+from ._batch import plt
+from ._boundary import render_adaptive
+from ._datasets import load_dataset, load_npz
+from ._instrument import instrument_class
+from ._interactive import BlitManager
+from ._mosaic import plot_mosaic, sample_indices, take_rows
+from ._nn import DenseNetwork
+from .exercise3 import Exercise3Utils
+
+
+@instrument_class
+class Exercise5Utils:
+
+    @staticmethod
+    def plot_images(X, y, mosaic=False):
+        if mosaic:
+            # one imshow of all 64 tiles instead of 64 axes
+            index = sample_indices(X.shape[0], 64, replace=True)
+            images = take_rows(X, index).reshape(-1, 28, 28)
+            return plot_mosaic(images, 8, 8, labels=np.int32(np.asarray(y)[index]), title="Label")
+
+        fig, axes = plt.subplots(8, 8, figsize=(5,5))
+        fig.tight_layout(pad=0.13,rect=[0, 0.03, 1, 0.91]) #[left, bottom, right, top]
+        m, n = X.shape
+
+        for i,ax in enumerate(axes.flat):
+            # Select random indices
+            random_index = np.random.randint(m)
+            
+            # Select rows corresponding to the random indices and
+            # reshape the image
+            X_random_reshaped = X[random_index].reshape((28,28))
+            
+            # Display the image
+            ax.imshow(X_random_reshaped, cmap='gray')
+            
+            # Display the label above the image
+            ax.set_title(np.int32(y[random_index]))
+            ax.set_axis_off()
+            fig.suptitle("Label", fontsize=14)
+
+
+    @staticmethod    
+    def plot_non_linear_decision_boundary(X, y, model, title="Decision Boundary", adaptive=True,
+                                          return_stats=False):
+        Exercise3Utils.plotData(X, y)
+        
+        h = .02  # Step size in the mesh
+        x_min, x_max = X[:, 0].min() - 0.1, X[:, 0].max() + 0.1
+        y_min, y_max = X[:, 1].min() - 0.1, X[:, 1].max() + 0.1
+        xs, ys = np.arange(x_min, x_max, h), np.arange(y_min, y_max, h)
+        
+        # Make predictions on the meshgrid points, refining only where the
+        # predicted class changes and interpolating the probabilities elsewhere
+        Z, stats = render_adaptive(lambda points: model.predict(points, verbose=0), xs, ys,
+                                   coarse_step=8 if adaptive else 1)
+        
+        # Plot the contour plot
+        plt.contourf(xs, ys, Z, cmap=plt.cm.RdBu, alpha=0.5)
+                
+        plt.show()      
+        if return_stats:
+            return stats
+
+
+    @staticmethod    
+    def plt_softmax(my_softmax, z_init=(1, 2, 3, 4), z_range=(0.1, 10.0), min_interval=1 / 30):
+        """
+        Bar charts of z and my_softmax(z) with one slider per logit. The
+        sliders and their BlitManager are kept alive on the figure as
+        fig.softmax_widgets = (sliders, blit).
+        """
+        from matplotlib.widgets import Slider
+
+        # one slider per logit, stacked below the bar charts
+        n = len(z_init)
+        height = 3.4 + 0.2 * n
+        fig, ax = plt.subplots(1,2,figsize=(8,height))
+        plt.subplots_adjust(bottom=(0.8 + 0.2 * n) / height)
+
+        sliders = []
+        for i, z0 in enumerate(z_init):
+            axz = fig.add_axes([0.15, (0.4 + 0.2 * i) / height, 0.30, 0.12 / height]) # [left, bottom, width, height]
+            slider = Slider(axz, f'z{i}', *z_range, valinit=z0, valstep=0.1)
+            # redrawn by the blit manager below instead of the whole figure
+            slider.drawon = False
+            sliders.append(slider)
+
+        def values():
+            return np.array([slider.val for slider in sliders])
+
+        z = np.array([f'z{i}' for i in range(n)])
+        bars = ax[0].barh(z, height=0.6, width=values(), left=None, align='center').get_children()
+        ax[0].set_xlim([0,z_range[1]])
+        ax[0].set_title("z input to softmax")
+
+        a = my_softmax(values())
+        anames = np.array([f'a{i}' for i in range(n)])
+        sbars = ax[1].barh(anames, height=0.6, width=a, left=None, align='center',color="#C00000").get_children()
+        ax[1].set_xlim([0,1])
+        ax[1].set_title("softmax(z)")
+
+        blit = BlitManager(fig, min_interval=min_interval)
+        for artist in bars + sbars:
+            blit.add_artist(artist)
+        for slider in sliders:
+            # the knob is not public (and missing in old matplotlib versions)
+            for artist in (slider.poly, getattr(slider, '_handle', None), slider.valtext):
+                if artist is not None:
+                    blit.add_artist(artist)
+
+        def update(val):
+            # all bars from a single softmax call, then one (throttled) blit
+            z = values()
+            a = my_softmax(z)
+            for bar, width in zip(bars, z):
+                bar.set_width(width)
+            for bar, width in zip(sbars, a):
+                bar.set_width(width)
+            blit.update()
+
+        for slider in sliders:
+            slider.on_changed(update)
+        # the canvas only holds weak references to the widgets' callbacks,
+        # so the figure keeps them alive as long as it is shown
+        fig.softmax_widgets = (sliders, blit)
+
+    @staticmethod
+    def display_images(X_all, mosaic=False):
+        """
+        Displays 2D data stored in X in a nice grid.
+        """
+        # Randomly select 100 data points to display, gathering only these
+        # rows (X_all may be memory-mapped)
+        rand_indices = sample_indices(X_all.shape[0], min(100, X_all.shape[0]))
+        X = take_rows(X_all, rand_indices)
+        
+        # Compute rows, cols
+        if X.ndim == 2:
+            m, n = X.shape
+        elif X.ndim == 1:
+            n = X.size
+            m = 1
+            X = X[None]  # Promote to a 2 dimensional array
+        else:
+            raise IndexError('Input X should be 1 or 2 dimensional.')
+
+        example_width = int(np.round(np.sqrt(n)))
+        example_height = n / example_width
+
+        # Compute number of items to display
+        display_rows = int(np.floor(np.sqrt(m)))
+        display_cols = int(np.ceil(m / display_rows))
+
+        if mosaic:
+            images = X.reshape(m, int(example_height), example_width)
+            return plot_mosaic(images, display_rows, display_cols, cmap='Greys', figsize=(10, 10))
+
+        fig, ax_array = plt.subplots(display_rows, display_cols, figsize=(10, 10))
+        # fig.subplots_adjust(wspace=0.025, hspace=0.025)
+
+        ax_array = [ax_array] if m == 1 else ax_array.ravel()
+
+        for i, ax in enumerate(ax_array):
+            ax.imshow(X[i].reshape(
+                example_width, 
+                example_width),
+                cmap='Greys', extent=[0, 1, 0, 1])
+            ax.axis('off') 
+
+
+    @staticmethod
+    def load_weights_task1(mmap_mode='r'):
+        """
+        Weights W1, b1, W2, b2 of the network of task 1, memory-mapped from
+        weights.npz (pass mmap_mode=None to read them into memory).
+        """
+        weights = load_dataset(load_npz, 'exercise5', 'weights.npz', mmap_mode=mmap_mode)
+        return weights["W1"], weights["b1"], weights["W2"], weights["b2"]
+
+    # DenseNetwork(*Exercise5Utils.load_weights_task1()).forward(X)
+    DenseNetwork = DenseNetwork
@@ -0,0 +1,102 @@
+import numpy as np
+
+from ._batch import plt
+from ._datasets import load_dataset
+from ._instrument import instrument_class
+from ._loss import loss_surface, mse
+
+
+@instrument_class
+class LinearAlgebraUtils:
+    @staticmethod
+    def Plotvec(u):
+        fig, ax = plt.subplots(1,1,figsize=(4,4))
+        ax.arrow(0, 0, *u, head_width=0.05, color='r', head_length=0.1)
+        plt.text(*(u + 0.1), 'u')    
+        plt.ylim(0, 2)
+        plt.xlim(0, 2)
+        plt.show()
+        
+    @staticmethod
+    def Plotvec1(u, z, v):
+        fig, ax = plt.subplots(1,1,figsize=(4,4))
+        ax.arrow(0, 0, *u, head_width=0.05, color='r', head_length=0.1)
+        plt.text(*(u + 0.1), 'u')
+        
+        ax.arrow(0, 0, *v, head_width=0.05, color='b', head_length=0.1)
+        plt.text(*(v + 0.1), 'v')
+        
+        ax.arrow(0, 0, *z, head_width=0.05, head_length=0.1)
+        plt.text(*(z + 0.1), 'z')
+        
+        plt.ylim(-2, 2)
+        plt.xlim(-2, 2)
+        plt.show()
+
+    @staticmethod
+    def Plotvec2(a,b):
+        fig, ax = plt.subplots(1,1,figsize=(4,4))
+        ax.arrow(0, 0, *a, head_width=0.05, color ='r', head_length=0.1)
+        plt.text(*(a + 0.1), 'a')
+        ax.arrow(0, 0, *b, head_width=0.05, color ='b', head_length=0.1)
+        plt.text(*(b + 0.1), 'b')
+        plt.ylim(-2, 2)
+        plt.xlim(-2, 2)
+        plt.show()
+
+    @staticmethod
+    def plot_points(x, y):
+        fig, ax = plt.subplots(1,1,figsize=(4,4))
+        _ = plt.scatter(x,y,color='red')
+        plt.ylabel("Salary (y)")
+        plt.title("Salary Data")
+        plt.xlabel("Experience (x)")
+        plt.show()
+
+    @staticmethod
+    def plot_regression_line(x, y, w0, w1):
+        fig, ax = plt.subplots(1,1,figsize=(4,4))
+        plt.scatter(x,y,color='red')
+        axes = plt.gca()
+        x_vals = np.array(axes.get_xlim())
+        y_vals = w0 + w1 * x_vals
+        _ = plt.plot(x_vals, y_vals, '--')
+        plt.ylabel("Salary (y)")
+        plt.title("Salary Data")
+        plt.xlabel("Experience (x)")
+        plt.show()
+
+    @staticmethod
+    def plot_mean_squared_error(x, y, w1, w0, compute_l=None, loss=None):
+        """
+        Plot the loss over w1 for a fixed w0. Both callables take the weights
+        in the order of this signature: compute_l(x, y, w1, w0) with scalar
+        weights, or the batched loss(x, y, w1, w0) with 1d arrays of w1 and
+        w0 values, returning one loss per entry (the MSE by default).
+        """
+        fig, ax = plt.subplots(1,1,figsize=(4,4))
+        axes = plt.gca()
+        w1_vals = np.arange(0, 20000, 100)
+        if compute_l is not None and loss is None:
+            L_vals = [compute_l(x, y, w1, w0) for w1 in w1_vals]
+        else:
+            # all w1 values at once; loss_surface passes (w0, w1)
+            batched = mse if loss is None else lambda x, y, w0, w1: loss(x, y, w1, w0)
+            L_vals = loss_surface(x, y, w0, w1_vals, loss=batched)
+
+        _ = plt.plot(w1_vals, L_vals, '--')
+
+        plt.ylabel("MSE")
+        plt.title("Mean Squared Loss")
+        plt.xlabel("$w_1$")
+        plt.show()
+        
+    loss_surface = staticmethod(loss_surface)
+
+    @staticmethod
+    def load_salary_data(mmap_mode=None):
+        train_data = load_dataset(np.loadtxt, 'linear_algebra', 'salary_data.csv', skiprows=1, delimiter=",",
+                                  mmap_mode=mmap_mode)
+        x = train_data[:, 0]
+        y = train_data[:, 1]        
+        return x, y